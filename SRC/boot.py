@@ -9,7 +9,11 @@ import pygame
 import sys
 import os
 import logging
-from typing import Dict, Any, Optional, Tuple
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Callable, FrozenSet, List, Optional, Tuple
 from config import *
 from loading import AssetLoader
 from models import GameState
@@ -17,28 +21,125 @@ from game import Game
 from ui import UIRenderer
 from environment import EnvironmentManager
 
+# Boot stage names, indexed by stage number
+BOOT_STAGES: Tuple[str, ...] = (
+    "Initializing Pygame",
+    "Loading Configuration",
+    "Setting up Display",
+    "Loading Assets",
+    "Initializing Audio",
+    "Creating Game State",
+    "Setting up UI",
+    "Initializing Environment",
+    "Preparing Game Systems",
+    "Final Setup"
+)
+
+# Assets loaded during boot (updated to lowercase)
+REQUIRED_ASSETS: Tuple[str, ...] = (
+    'moon.png',
+    'sun.png',
+    'power.png',
+    'tent.png',
+    'shack.png',
+    'small_home.png',
+    'large_home.png',
+    'nanos.png'
+)
+
+# Assets required for basic functionality - loaded before boot returns
+CRITICAL_ASSETS: FrozenSet[str] = frozenset({'nanos.png'})
+
+# Boot screen colors
+BOOT_BG_COLOR = (20, 20, 30)
+BOOT_ERROR_BG_COLOR = (50, 20, 20)
+BOOT_TEST_BG_COLOR = (50, 50, 50)
+TITLE_COLOR = (0, 255, 255)
+TEXT_COLOR = (255, 255, 255)
+STAGE_TEXT_COLOR = (200, 200, 200)
+BAR_BG_COLOR = (60, 60, 60)
+BAR_FILL_COLOR = (0, 255, 255)
+SUCCESS_COLOR = (0, 255, 0)
+ERROR_COLOR = (255, 0, 0)
+
+# SDL/pygame subsystem probe results - cleared when pygame shuts down
+_PROBE_CACHE: Dict[str, Any] = {}
+
+# The pygame build cannot change while the process runs
+_PYGAME_VERSION = pygame.version.ver
+
+def _cached_probe(name: str, probe: Callable[[], Any]) -> Any:
+    """Run a pygame probe once and reuse its result until cleanup"""
+    try:
+        return _PROBE_CACHE[name]
+    except KeyError:
+        result = _PROBE_CACHE[name] = probe()
+        return result
+
+# Boot path file probes - stat once at import, reused by every boot in this process.
+# The paths are config's __file__-relative ones, so boot works from any directory.
+_ICON_FILE = ASSETS_DIR / 'icon.png'
+_BOOT_LOG_FILE = LOGS_DIR / 'nanoverse_boot.log'
+_BOOT_PROBE: Dict[Path, bool] = {
+    path: path.exists()
+    for path in (_ICON_FILE, SETTINGS_FILE, LOGS_DIR, ASSET_ATLAS, ASSET_ATLAS_INDEX)
+}
+
+# Shared by every boot log handler
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+# Boot stage table, indexed by stage number:
+# (progress, method name, prerequisite stages, runs on main thread)
+# Main thread stages are listed in topological order.
+_STAGES = (
+    (0.0, 'initialize_pygame',      (),        True),   # Initializing Pygame
+    (0.1, 'load_configuration',     (),        True),   # Loading Configuration
+    (0.2, 'setup_display',          (0,),      True),   # Setting up Display
+    (0.3, 'load_assets',            (1, 2),    True),   # Loading Assets (convert() belongs on the display's thread)
+    (0.5, 'initialize_audio',       (0,),      False),  # Initializing Audio
+    (0.6, 'create_game_state',      (1,),      False),  # Creating Game State
+    (0.7, 'setup_ui',               (2,),      True),   # Setting up UI
+    (0.8, 'initialize_environment', (1,),      False),  # Initializing Environment
+    (0.9, 'prepare_game_systems',   (3, 5, 7), True),   # Preparing Game Systems
+    (1.0, 'final_setup',            (4, 6, 8), True)    # Final Setup
+)
+
+# Off-thread stages only wait on main thread stages, so any pool size
+# finishes; config's MAX_WORKER_THREADS caps it, with no idle extras
+_BOOT_WORKERS = max(1, min(MAX_WORKER_THREADS, sum(1 for stage in _STAGES if not stage[3])))
+
+@functools.lru_cache(maxsize=8)
+def _get_font(size: int) -> pygame.font.Font:
+    """Get the default font at a size (built once per size)"""
+    return pygame.font.Font(None, size)
+
+@functools.lru_cache(maxsize=16)
+def _render_static_text(text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render text that never changes between boot screen frames"""
+    return _get_font(size).render(text, True, color)
+
 class BootManager:
     """Manages the boot sequence and system initialization"""
     
     def __init__(self):
         self.boot_stage = 0
-        self.boot_stages = [
-            "Initializing Pygame",
-            "Loading Configuration", 
-            "Setting up Display",
-            "Loading Assets",
-            "Initializing Audio",
-            "Creating Game State",
-            "Setting up UI",
-            "Initializing Environment",
-            "Preparing Game Systems",
-            "Final Setup"
-        ]
+        self.boot_stages = BOOT_STAGES
         self.boot_progress = 0.0
         self.boot_complete = False
         self.error_occurred = False
         self.error_message = ""
         
+        # Stage scheduling state (see boot_game)
+        self._stage_events = []
+        self._stage_results = []
+        self._boot_failed = threading.Event()
+        self._current_stage = threading.local()
+        
+        # Boot screen dirty-rect state (see _init_boot_screen)
+        self._boot_screen_ready = False
+        self._boot_stage_rect = None
+        self._boot_percent_rect = None
+        
         # Systems to initialize
         self.screen = None
         self.clock = None
@@ -47,6 +148,10 @@ class BootManager:
         self.game = None
         self.ui_renderer = None
         self.environment_manager = None
+        self.deferred_loader = None  # Background asset thread started by load_assets
+        self._mixer_thread = None  # Audio device thread started by initialize_pygame
+        self._mixer_error = None
+        self._loaded_set = set()  # Asset names load_assets has loaded
         
         # Settings
         self.fullscreen = False
@@ -63,64 +168,23 @@ class BootManager:
             self.setup_logging()
             logging.info("=== NANOVERSE BATTERY BOOT SEQUENCE ===")
             
-            # Stage 0: Initialize Pygame
-            self.boot_stage = 0
-            self.update_progress(0.0)
-            if not self.initialize_pygame():
-                return False, None
-                
-            # Stage 1: Load Configuration
-            self.boot_stage = 1
-            self.update_progress(0.1)
-            if not self.load_configuration():
-                return False, None
-                
-            # Stage 2: Set up Display
-            self.boot_stage = 2
-            self.update_progress(0.2)
-            if not self.setup_display():
-                return False, None
-                
-            # Stage 3: Load Assets
-            self.boot_stage = 3
-            self.update_progress(0.3)
-            if not self.load_assets():
-                return False, None
-                
-            # Stage 4: Initialize Audio
-            self.boot_stage = 4
-            self.update_progress(0.5)
-            if not self.initialize_audio():
-                return False, None
-                
-            # Stage 5: Create Game State
-            self.boot_stage = 5
-            self.update_progress(0.6)
-            if not self.create_game_state():
-                return False, None
-                
-            # Stage 6: Set up UI
-            self.boot_stage = 6
-            self.update_progress(0.7)
-            if not self.setup_ui():
-                return False, None
-                
-            # Stage 7: Initialize Environment
-            self.boot_stage = 7
-            self.update_progress(0.8)
-            if not self.initialize_environment():
-                return False, None
-                
-            # Stage 8: Prepare Game Systems
-            self.boot_stage = 8
-            self.update_progress(0.9)
-            if not self.prepare_game_systems():
-                return False, None
-                
-            # Stage 9: Final Setup
-            self.boot_stage = 9
-            self.update_progress(1.0)
-            if not self.final_setup():
+            # One completion event and result slot per stage
+            self._stage_events = [threading.Event() for _ in _STAGES]
+            self._stage_results = [False] * len(_STAGES)
+            self._boot_failed.clear()
+            
+            with ThreadPoolExecutor(max_workers=_BOOT_WORKERS, thread_name_prefix="boot") as executor:
+                # Off-thread stages wait on their own prerequisites
+                for index, (_, _, _, main_thread) in enumerate(_STAGES):
+                    if not main_thread:
+                        executor.submit(self._run_stage, index)
+                        
+                # Main thread stages run in order (skipped stages still signal)
+                for index, (_, _, _, main_thread) in enumerate(_STAGES):
+                    if main_thread:
+                        self._run_stage(index)
+                        
+            if not all(self._stage_results):
                 return False, None
                 
             self.boot_complete = True
@@ -145,58 +209,90 @@ class BootManager:
             logging.error(self.error_message)
             return False, None
             
-    def update_progress(self, progress: float):
-        """Update boot progress and display"""
-        self.boot_progress = progress
-        stage_name = self.boot_stages[self.boot_stage] if self.boot_stage < len(self.boot_stages) else "Unknown"
-        logging.info(f"Boot Stage {self.boot_stage}: {stage_name} ({progress*100:.1f}%)")
+    def _run_stage(self, index: int) -> bool:
+        """Run a boot stage once all of its prerequisites have finished"""
+        success = False
+        try:
+            progress, fn_name, dependencies, _ = _STAGES[index]
+            for dependency in dependencies:
+                self._stage_events[dependency].wait()
+                
+            # Abort like the sequential boot did once any stage has failed
+            if self._boot_failed.is_set() or not all(self._stage_results[d] for d in dependencies):
+                logging.info(f"Skipping boot stage {index}: an earlier stage failed")
+                return False
+                
+            if threading.current_thread() is threading.main_thread():
+                self.boot_stage = index
+            self._current_stage.index = index
+            self.update_progress(progress)
+            
+            success = getattr(self, fn_name)()
+            return success
+            
+        except Exception as e:
+            self.error_message = f"Boot failed at stage {index}: {str(e)}"
+            logging.error(self.error_message)
+            return False
+            
+        finally:
+            if not success:
+                self._boot_failed.set()
+            self._stage_results[index] = success
+            self._stage_events[index].set()
+            
+    def update_progress(self, progress: float, *, render: bool = True):
+        """Update boot progress and display (render=False for sub-stage ticks)"""
+        stage = getattr(self._current_stage, 'index', self.boot_stage)
+        self.boot_progress = max(self.boot_progress, progress)
+        stage_name = self.boot_stages[stage] if stage < len(self.boot_stages) else "Unknown"
+        logging.info(f"Boot Stage {stage}: {stage_name} ({progress*100:.1f}%)")
         
-        # If screen is available, show boot screen
-        if self.screen:
-            self.render_boot_screen(stage_name, progress)
+        # If screen is available, show boot screen (display calls stay on the main thread)
+        if render and self.screen and threading.current_thread() is threading.main_thread():
+            self.render_boot_screen(stage_name, self.boot_progress)
             
     def setup_logging(self):
         """Initialize logging system"""
-        log_format = '%(asctime)s - %(levelname)s - %(message)s'
         log_level = logging.DEBUG if self.debug_mode else logging.INFO
         
         # Create logs directory if it doesn't exist
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
-            
-        # Set up logging to file and console
-        logging.basicConfig(
-            level=log_level,
-            format=log_format,
-            handlers=[
-                logging.FileHandler('logs/nanoverse_boot.log', mode='w'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        if not _BOOT_PROBE[LOGS_DIR]:
+            os.makedirs(LOGS_DIR, exist_ok=True)
+            _BOOT_PROBE[LOGS_DIR] = True
+        
+        # Set up logging to file and console (file is opened on first record)
+        handlers = [
+            logging.FileHandler(_BOOT_LOG_FILE, mode='w', delay=True),
+            logging.StreamHandler(sys.stdout)
+        ]
+        for handler in handlers:
+            handler.setFormatter(_LOG_FORMATTER)
+            
+        logging.basicConfig(level=log_level, handlers=handlers)
         
     def initialize_pygame(self) -> bool:
         """Initialize Pygame and its subsystems"""
         try:
-            # Initialize core Pygame
-            pygame.init()
-            logging.info("Pygame core initialized")
-            
-            # Initialize specific subsystems
+            # Fonts, text and probe results cached by an earlier boot are only
+            # stale if that pygame was quit since - otherwise keep reusing them
             if not pygame.display.get_init():
-                pygame.display.init()
-                logging.info("Pygame display subsystem initialized")
+                _render_static_text.cache_clear()
+                _get_font.cache_clear()
+                _PROBE_CACHE.clear()
                 
-            if not pygame.font.get_init():
-                pygame.font.init()
-                logging.info("Pygame font subsystem initialized")
+            # Bring up only what the main thread needs - the mixer opens on its
+            # own thread so audio device probing overlaps display creation
+            pygame.display.init()
+            pygame.font.init()
+            
+            if self.audio_enabled:
+                self._mixer_thread = threading.Thread(target=self._open_mixer, name="mixer-init", daemon=True)
+                self._mixer_thread.start()
                 
             # Initialize clock
             self.clock = pygame.time.Clock()
-            logging.info("Pygame clock initialized")
-            
-            # Check Pygame version
-            pygame_version = pygame.version.ver
-            logging.info(f"Pygame version: {pygame_version}")
+            logging.info(f"Pygame {_PYGAME_VERSION} initialized (display, font, clock, mixer opening in background)")
             
             return True
             
@@ -209,8 +305,8 @@ class BootManager:
         """Load game configuration settings"""
         try:
             # Load settings from config file if it exists
-            config_file = 'config/settings.ini'
-            if os.path.exists(config_file):
+            config_file = SETTINGS_FILE
+            if _BOOT_PROBE[config_file]:
                 logging.info(f"Loading configuration from {config_file}")
                 # Future: Load from INI file
                 pass
@@ -251,8 +347,8 @@ class BootManager:
             pygame.display.set_caption(GAME_TITLE)
             
             # Try to set window icon if available
-            icon_path = os.path.join('assets', 'icon.png')
-            if os.path.exists(icon_path):
+            icon_path = _ICON_FILE
+            if _BOOT_PROBE[icon_path]:
                 try:
                     icon = pygame.image.load(icon_path)
                     pygame.display.set_icon(icon)
@@ -266,7 +362,7 @@ class BootManager:
                 pass
                 
             logging.info(f"Display initialized: {WINDOW_WIDTH}x{WINDOW_HEIGHT}")
-            logging.info(f"Display driver: {pygame.display.get_driver()}")
+            logging.info(f"Display driver: {_cached_probe('display_driver', pygame.display.get_driver)}")
             
             return True
             
@@ -278,32 +374,41 @@ class BootManager:
     def load_assets(self) -> bool:
         """Load all game assets"""
         try:
+            # Surfaces are converted to the display format as they load
+            assert pygame.display.get_surface() is not None, "load_assets needs the display surface"
+            
             self.asset_loader = AssetLoader()
             
-            # Define required assets (updated to lowercase)
-            required_assets = [
-                'moon.png',
-                'sun.png', 
-                'power.png',
-                'tent.png',
-                'shack.png',
-                'small_home.png',
-                'large_home.png',
-                'nanos.png'
-            ]
+            # Packed texture atlas replaces the per-file loads when present
+            if _BOOT_PROBE[ASSET_ATLAS] and _BOOT_PROBE[ASSET_ATLAS_INDEX]:
+                self._loaded_set.update(self.asset_loader.load_atlas(ASSET_ATLAS, ASSET_ATLAS_INDEX))
+                
+            # Assets required for basic functionality load now, the rest stream in after boot
+            critical_assets = sorted(CRITICAL_ASSETS)
+            deferred_assets = [name for name in REQUIRED_ASSETS
+                               if name not in CRITICAL_ASSETS and not self.asset_loader.is_loaded(name)]
+            
+            # Without background loading everything loads before boot moves on
+            if not USE_BACKGROUND_LOADING:
+                critical_assets += deferred_assets
+                deferred_assets = []
+                
+            # Start reading every remaining file before decoding any of them
+            self.asset_loader.prefetch_files(REQUIRED_ASSETS)
             
-            # Load all assets
+            # Load critical assets (anything not in the atlas falls back to its own file)
             success_count = 0
-            total_assets = len(required_assets)
+            total_assets = len(critical_assets)
             
-            for i, asset_name in enumerate(required_assets):
+            for i, asset_name in enumerate(critical_assets):
                 try:
                     # Update progress for each asset
                     asset_progress = 0.3 + (i / total_assets) * 0.2  # Assets take 20% of boot time
-                    self.update_progress(asset_progress)
+                    self.update_progress(asset_progress, render=False)
                     
                     if self.asset_loader.load_asset(asset_name):
                         success_count += 1
+                        self._loaded_set.add(asset_name)
                         logging.info(f"Loaded asset: {asset_name}")
                     else:
                         logging.warning(f"Failed to load asset: {asset_name}")
@@ -311,14 +416,22 @@ class BootManager:
                 except Exception as e:
                     logging.warning(f"Error loading asset {asset_name}: {str(e)}")
                     
-            # Check if critical assets loaded
-            critical_assets = ['nanos.png']  # Assets required for basic functionality
-            critical_loaded = all(self.asset_loader.get_asset(asset) is not None for asset in critical_assets)
+            # Persist decoded pixels for the next boot
+            self.asset_loader.save_decode_cache()
             
-            if not critical_loaded:
-                logging.error("Critical assets missing - game may not function properly")
+            # Check if critical assets loaded
+            missing_critical = CRITICAL_ASSETS - self._loaded_set
+            if missing_critical:
+                logging.error(f"Critical assets missing - game may not function properly: {sorted(missing_critical)}")
+                
+            # Stream the rest in the background - get_asset blocks on anything not ready yet
+            if deferred_assets:
+                self.asset_loader.mark_pending(deferred_assets)
+                self.deferred_loader = threading.Thread(target=self._load_deferred, args=(deferred_assets,),
+                                                        name="asset-loader", daemon=True)
+                self.deferred_loader.start()
                 
-            logging.info(f"Assets loaded: {success_count}/{total_assets}")
+            logging.info(f"Assets loaded: {success_count}/{total_assets} critical, {len(deferred_assets)} deferred")
             return True  # Continue even if some assets failed
             
         except Exception as e:
@@ -326,18 +439,58 @@ class BootManager:
             logging.error(self.error_message)
             return False
             
+    def _load_one(self, asset_name: str) -> Tuple[str, bool]:
+        """Decode one deferred asset - conversion happens later on the main thread"""
+        try:
+            if self.asset_loader.load_asset(asset_name, defer_convert=True):
+                logging.info(f"Decoded deferred asset: {asset_name}")
+                return asset_name, True
+                
+            logging.warning(f"Failed to load deferred asset: {asset_name}")
+            
+        except Exception as e:
+            logging.warning(f"Error loading deferred asset {asset_name}: {str(e)}")
+            
+        return asset_name, False
+        
+    def _load_deferred(self, asset_names: List[str]):
+        """Load non-critical assets after boot has moved on"""
+        # Decodes are independent, so spread them over a worker pool
+        with ThreadPoolExecutor(max_workers=max(1, MAX_WORKER_THREADS),
+                                thread_name_prefix="asset-decode") as executor:
+            results = list(executor.map(self._load_one, asset_names))
+            
+        loaded_count = sum(1 for _, loaded in results if loaded)
+        self.asset_loader.save_decode_cache()
+        logging.info(f"Deferred assets decoded: {loaded_count}/{len(asset_names)}")
+        
+    def _open_mixer(self):
+        """Open the audio device (runs on its own thread, see initialize_pygame)"""
+        try:
+            pygame.mixer.pre_init(frequency=AUDIO_FREQUENCY, size=AUDIO_SIZE,
+                                  channels=AUDIO_CHANNELS, buffer=AUDIO_BUFFER)
+            pygame.mixer.init()
+        except Exception as e:
+            self._mixer_error = e
+            
     def initialize_audio(self) -> bool:
         """Initialize audio system"""
         try:
             if self.audio_enabled:
-                # Initialize pygame mixer
-                pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
-                pygame.mixer.init()
-                
+                # The mixer has been opening since stage 0 - just wait for it
+                if self._mixer_thread:
+                    self._mixer_thread.join()
+                else:
+                    self._open_mixer()
+                    
+                if self._mixer_error:
+                    raise self._mixer_error
+                    
                 # Test audio system
-                if pygame.mixer.get_init():
+                mixer_settings = _cached_probe('mixer_init', pygame.mixer.get_init)
+                if mixer_settings:
                     logging.info("Audio system initialized successfully")
-                    logging.info(f"Audio settings: {pygame.mixer.get_init()}")
+                    logging.info(f"Audio settings: {mixer_settings}")
                 else:
                     logging.warning("Audio system failed to initialize")
                     self.audio_enabled = False
@@ -356,18 +509,19 @@ class BootManager:
         """Create and initialize game state"""
         try:
             self.game_state = GameState()
+            runtime = get_runtime_config()
             
             # Initialize with starting resources
-            self.game_state.resources.credits = STARTING_CREDITS
+            self.game_state.resources.credits = runtime.starting_credits
             self.game_state.resources.eu = 0.0
-            self.game_state.resources.work_power = STARTING_WORK_POWER
+            self.game_state.resources.work_power = runtime.starting_work_power
             
             # Generate initial hire candidates
             self.game_state.generate_hire_candidates()
             
             logging.info("Game state created successfully")
-            logging.info(f"Starting credits: {STARTING_CREDITS}")
-            logging.info(f"Starting work power: {STARTING_WORK_POWER}")
+            logging.info(f"Starting credits: {runtime.starting_credits}")
+            logging.info(f"Starting work power: {runtime.starting_work_power}")
             
             return True
             
@@ -416,7 +570,7 @@ class BootManager:
     def prepare_game_systems(self) -> bool:
         """Prepare main game systems"""
         try:
-            if not all([self.screen, self.clock, self.game_state]):
+            if None in (self.screen, self.clock, self.game_state):
                 raise ValueError("Required systems not initialized")
                 
             # Create main game instance
@@ -457,13 +611,17 @@ class BootManager:
                 ('game_state', self.game_state)
             ]
             
-            for system_name, system in required_systems:
-                if system is None:
-                    raise ValueError(f"Required system not initialized: {system_name}")
+            missing_systems = [system_name for system_name, system in required_systems if system is None]
+            if missing_systems:
+                raise ValueError(f"Required system not initialized: {', '.join(missing_systems)}")
                     
+            # Pick up any background-decoded assets before the first render
+            if self.asset_loader:
+                self.asset_loader.finish_pending_conversions()
+                
             # Perform initial render to test systems
             try:
-                self.screen.fill((50, 50, 50))
+                self.screen.fill(BOOT_TEST_BG_COLOR)
                 self.render_boot_complete()
                 pygame.display.flip()
             except Exception as e:
@@ -504,56 +662,81 @@ class BootManager:
         except Exception as e:
             logging.warning(f"System tests encountered error: {str(e)}")
             
+    def _init_boot_screen(self):
+        """Paint the parts of the boot screen that never change"""
+        # Clear screen
+        self.screen.fill(BOOT_BG_COLOR)
+        
+        # Draw title
+        title_text = _render_static_text("NANOVERSE BATTERY", 48, TITLE_COLOR)
+        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100))
+        self.screen.blit(title_text, title_rect)
+        
+        # Draw subtitle
+        subtitle_text = _render_static_text("Initializing...", 32, TEXT_COLOR)
+        subtitle_rect = subtitle_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 60))
+        self.screen.blit(subtitle_text, subtitle_rect)
+        
+        pygame.display.flip()
+        
+        # Text rects from the previous frame, cleared before the next draw
+        self._boot_stage_rect = None
+        self._boot_percent_rect = None
+        self._boot_screen_ready = True
+        
+    def _redraw_boot_text(self, text: pygame.Surface, rect: pygame.Rect,
+                          previous_rect: Optional[pygame.Rect]) -> pygame.Rect:
+        """Replace a line of boot screen text - returns the area that changed"""
+        dirty_rect = rect
+        if previous_rect:
+            self.screen.fill(BOOT_BG_COLOR, previous_rect)
+            dirty_rect = rect.union(previous_rect)
+            
+        self.screen.blit(text, rect)
+        return dirty_rect
+        
     def render_boot_screen(self, stage_name: str, progress: float):
         """Render boot progress screen"""
         if not self.screen:
             return
             
         try:
-            # Clear screen
-            self.screen.fill((20, 20, 30))
-            
-            # Create fonts
-            font_large = pygame.font.Font(None, 48)
-            font_medium = pygame.font.Font(None, 32)
-            font_small = pygame.font.Font(None, 24)
-            
-            # Draw title
-            title_text = font_large.render("NANOVERSE BATTERY", True, (0, 255, 255))
-            title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100))
-            self.screen.blit(title_text, title_rect)
-            
-            # Draw subtitle
-            subtitle_text = font_medium.render("Initializing...", True, (255, 255, 255))
-            subtitle_rect = subtitle_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 60))
-            self.screen.blit(subtitle_text, subtitle_rect)
+            # Static backdrop is painted once, later frames only touch what changed
+            if not self._boot_screen_ready:
+                self._init_boot_screen()
+                
+            font_small = _get_font(24)
+            dirty_rects = []
             
             # Draw stage name
-            stage_text = font_small.render(stage_name, True, (200, 200, 200))
+            stage_text = font_small.render(stage_name, True, STAGE_TEXT_COLOR)
             stage_rect = stage_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20))
-            self.screen.blit(stage_text, stage_rect)
+            dirty_rects.append(self._redraw_boot_text(stage_text, stage_rect, self._boot_stage_rect))
+            self._boot_stage_rect = stage_rect
             
             # Draw progress bar
             bar_width = 400
             bar_height = 20
             bar_x = (WINDOW_WIDTH - bar_width) // 2
             bar_y = WINDOW_HEIGHT // 2 + 20
+            bar_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
             
             # Background
-            pygame.draw.rect(self.screen, (60, 60, 60), 
-                           (bar_x, bar_y, bar_width, bar_height))
+            pygame.draw.rect(self.screen, BAR_BG_COLOR, bar_rect)
             
             # Progress fill
             fill_width = int(bar_width * progress)
-            pygame.draw.rect(self.screen, (0, 255, 255), 
+            pygame.draw.rect(self.screen, BAR_FILL_COLOR, 
                            (bar_x, bar_y, fill_width, bar_height))
+            dirty_rects.append(bar_rect)
             
             # Progress text
-            progress_text = font_small.render(f"{progress * 100:.1f}%", True, (255, 255, 255))
+            progress_text = font_small.render(f"{progress * 100:.1f}%", True, TEXT_COLOR)
             progress_rect = progress_text.get_rect(center=(WINDOW_WIDTH // 2, bar_y + bar_height + 30))
-            self.screen.blit(progress_text, progress_rect)
+            dirty_rects.append(self._redraw_boot_text(progress_text, progress_rect, self._boot_percent_rect))
+            self._boot_percent_rect = progress_rect
             
-            pygame.display.flip()
+            pygame.display.update(dirty_rects)
             
         except Exception as e:
             logging.warning(f"Failed to render boot screen: {str(e)}")
@@ -564,18 +747,16 @@ class BootManager:
             return
             
         try:
-            self.screen.fill((20, 20, 30))
-            
-            font_large = pygame.font.Font(None, 48)
-            font_medium = pygame.font.Font(None, 32)
+            self.screen.fill(BOOT_BG_COLOR)
+            self._boot_screen_ready = False
             
             # Success message
-            success_text = font_large.render("BOOT COMPLETE", True, (0, 255, 0))
+            success_text = _render_static_text("BOOT COMPLETE", 48, SUCCESS_COLOR)
             success_rect = success_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
             self.screen.blit(success_text, success_rect)
             
             # Instructions
-            instruction_text = font_medium.render("Press any key to continue...", True, (255, 255, 255))
+            instruction_text = _render_static_text("Press any key to continue...", 32, TEXT_COLOR)
             instruction_rect = instruction_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
             self.screen.blit(instruction_text, instruction_rect)
             
@@ -588,13 +769,13 @@ class BootManager:
             return
             
         try:
-            self.screen.fill((50, 20, 20))
+            self.screen.fill(BOOT_ERROR_BG_COLOR)
+            self._boot_screen_ready = False
             
-            font_large = pygame.font.Font(None, 48)
-            font_medium = pygame.font.Font(None, 24)
+            font_medium = _get_font(24)
             
             # Error message
-            error_text = font_large.render("BOOT FAILED", True, (255, 0, 0))
+            error_text = _render_static_text("BOOT FAILED", 48, ERROR_COLOR)
             error_rect = error_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
             self.screen.blit(error_text, error_rect)
             
@@ -602,7 +783,7 @@ class BootManager:
             if self.error_message:
                 lines = self.error_message.split('\n')
                 for i, line in enumerate(lines[:3]):  # Show max 3 lines
-                    detail_text = font_medium.render(line, True, (255, 255, 255))
+                    detail_text = font_medium.render(line, True, TEXT_COLOR)
                     detail_rect = detail_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + i * 25))
                     self.screen.blit(detail_text, detail_rect)
                     
@@ -614,10 +795,18 @@ class BootManager:
     def cleanup(self):
         """Clean up resources"""
         try:
+            if self.deferred_loader:
+                self.deferred_loader.join(timeout=5.0)
+                
             if self.asset_loader:
                 self.asset_loader.cleanup()
                 
+            # Cached fonts and text die with pygame.font
+            _render_static_text.cache_clear()
+            _get_font.cache_clear()
+            
             pygame.quit()
+            _PROBE_CACHE.clear()
             logging.info("Boot manager cleanup completed")
             
         except Exception as e:
@@ -0,0 +1,74 @@
+"""
+build_atlas.py - Texture Atlas Builder for Nanoverse Battery
+
+Packs the core game images into a single atlas.png with an atlas.json
+index (name -> [x, y, width, height]) so the game can load every texture
+with one file read and one decode. Run from the SRC folder:
+
+    python build_atlas.py
+"""
+
+import os
+import sys
+import json
+import pygame
+from typing import Dict, List, Tuple
+from config import *
+
+# Widest row before the packer starts a new shelf
+ATLAS_MAX_WIDTH = 1024
+
+def pack_shelves(sizes: Dict[str, Tuple[int, int]], max_width: int = ATLAS_MAX_WIDTH) -> Tuple[Dict[str, List[int]], int, int]:
+    """Place images on horizontal shelves, tallest first - returns (rects, width, height)"""
+    rects = {}
+    shelf_x = 0
+    shelf_y = 0
+    shelf_height = 0
+    atlas_width = 0
+    
+    for name in sorted(sizes, key=lambda n: sizes[n][1], reverse=True):
+        width, height = sizes[name]
+        
+        # Start a new shelf when this image does not fit on the current one
+        if shelf_x > 0 and shelf_x + width > max_width:
+            shelf_y += shelf_height
+            shelf_x = 0
+            shelf_height = 0
+            
+        rects[name] = [shelf_x, shelf_y, width, height]
+        shelf_x += width
+        shelf_height = max(shelf_height, height)
+        atlas_width = max(atlas_width, shelf_x)
+        
+    return rects, atlas_width, shelf_y + shelf_height
+
+def build_atlas(assets_dir: str = ASSETS_DIR, atlas_file: str = ASSET_ATLAS,
+                index_file: str = ASSET_ATLAS_INDEX) -> bool:
+    """Compose ATLAS_TEXTURES into one image and write its index"""
+    try:
+        images = {}
+        for name in ATLAS_TEXTURES:
+            images[name] = pygame.image.load(os.path.join(assets_dir, name))
+            
+        rects, width, height = pack_shelves({name: image.get_size() for name, image in images.items()})
+        
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        atlas.fill((0, 0, 0, 0))  # Transparent
+        for name, image in images.items():
+            atlas.blit(image, rects[name][:2])
+            
+        pygame.image.save(atlas, atlas_file)
+        with open(index_file, 'w') as f:
+            json.dump(rects, f, indent=2)
+            
+        print(f"Built {atlas_file} ({width}x{height}) with {len(rects)} images")
+        return True
+        
+    except Exception as e:
+        print(f"Failed to build atlas: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    sys.exit(0 if build_atlas() else 1)
+
+#EOF BUILD_ATLAS.PY # 74 lines
@@ -6,7 +6,15 @@ All other modules import their configuration values from here.
 """
 
 import os
-from typing import Tuple, Dict, Any
+import mmap
+import logging
+import dataclasses
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import cached_property, lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Tuple, Dict, Any, Final, Mapping, NamedTuple, Optional
 
 # ============================================================================
 # GAME METADATA
@@ -24,22 +32,22 @@ GAME_DESCRIPTION = "Develop a universe in a box to power a console"
 # Window dimensions
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
-MIN_WINDOW_WIDTH = 800
-MIN_WINDOW_HEIGHT = 600
-MAX_WINDOW_WIDTH = 1920
-MAX_WINDOW_HEIGHT = 1080
+MIN_WINDOW_WIDTH: Final[int] = 800
+MIN_WINDOW_HEIGHT: Final[int] = 600
+MAX_WINDOW_WIDTH: Final[int] = 1920
+MAX_WINDOW_HEIGHT: Final[int] = 1080
 
 # Display options
 DEFAULT_FULLSCREEN = False
 DEFAULT_VSYNC = True
-TARGET_FPS = 60
+TARGET_FPS: Final[int] = 60
 ALLOW_RESIZE = True
 
 # UI Layout dimensions
-UI_PANEL_WIDTH = 300      # Left control panel width
-INFO_PANEL_WIDTH = 250    # Right info panel width
-TIME_BAR_HEIGHT = 50      # Top time bar height
-STATUS_BAR_HEIGHT = 80    # Bottom status bar height
+UI_PANEL_WIDTH: Final[int] = 300      # Left control panel width
+INFO_PANEL_WIDTH: Final[int] = 250    # Right info panel width
+TIME_BAR_HEIGHT: Final[int] = 50      # Top time bar height
+STATUS_BAR_HEIGHT: Final[int] = 80    # Bottom status bar height
 
 # Play area calculations (dynamic based on window size)
 PLAY_AREA_WIDTH = WINDOW_WIDTH - UI_PANEL_WIDTH - INFO_PANEL_WIDTH - 30
@@ -48,8 +56,11 @@ PLAY_AREA_CENTER_X = PLAY_AREA_WIDTH // 2
 PLAY_AREA_CENTER_Y = PLAY_AREA_HEIGHT // 2
 
 # Grid system
-GRID_SIZE = 32            # Size of each grid cell in pixels
-GRID_ALPHA = 100          # Transparency of grid lines (0-255)
+GRID_SIZE: Final[int] = 32            # Size of each grid cell in pixels
+GRID_ALPHA: Final[int] = 100          # Transparency of grid lines (0-255)
+GRID_COLS: Final[int] = PLAY_AREA_WIDTH // GRID_SIZE   # Grid cells across the play area
+GRID_ROWS: Final[int] = PLAY_AREA_HEIGHT // GRID_SIZE  # Grid cells down the play area
+BUILDING_BUCKET_SIZE: Final[int] = GRID_SIZE * 2  # Pixel size of building proximity buckets
 
 # ============================================================================
 # GAME MECHANICS
@@ -72,15 +83,27 @@ WORK_BUTTON_EU = 0.1            # EU produced per work button press
 UPGRADE_COST = 1.0              # Credits to upgrade work power
 UPGRADE_AMOUNT = 0.1            # EU increase per upgrade
 
-# Building costs (EU, Credits)
-BUILDING_COSTS = {
-    "CELL": (1.0, 100.0),
-    "BIO": (10.0, 1000.0),
-    "TENT": (10.0, 100.0),
-    "STUDY": (10.0, 100.0),
-    "MUSIC": (10.0, 500.0),
-    "CAMP": (10.0, 250.0)
-}
+# Building kinds; values index BUILDING_COSTS
+class BuildingKind(IntEnum):
+    CELL = 0
+    BIO = 1
+    TENT = 2
+    STUDY = 3
+    MUSIC = 4
+    CAMP = 5
+
+# Building kind names to BUILDING_COSTS index
+BUILDING_KIND_INDEX: Dict[str, int] = {kind.name: kind.value for kind in BuildingKind}
+
+# Building costs (EU, Credits), indexed by BuildingKind
+BUILDING_COSTS: Tuple[Tuple[float, float], ...] = (
+    (1.0, 100.0),     # CELL
+    (10.0, 1000.0),   # BIO
+    (10.0, 100.0),    # TENT
+    (10.0, 100.0),    # STUDY
+    (10.0, 500.0),    # MUSIC
+    (10.0, 250.0)     # CAMP
+)
 
 # Building capacities (max workers)
 BUILDING_CAPACITIES = {
@@ -202,52 +225,54 @@ FLOATING_LABEL_LIFETIME = 2.0   # Seconds before floating text disappears
 PROGRESS_BAR_SMOOTH_SPEED = 5.0 # Speed of progress bar animations
 
 # ============================================================================
-# COLORS (RGB tuples)
+# COLORS (RGB tuples - immutable, so every importer can share them)
 # ============================================================================
 
+ColorType = Tuple[int, int, int]
+
 # UI Colors
-COLOR_BACKGROUND = (50, 50, 50)         # Main background
-COLOR_PANEL = (70, 70, 70)              # UI panels
-COLOR_BUTTON = (100, 100, 100)          # Default buttons
-COLOR_BUTTON_HOVER = (120, 120, 120)    # Hovered buttons
-COLOR_BUTTON_PRESSED = (80, 80, 80)     # Pressed buttons
-COLOR_BUTTON_DISABLED = (60, 60, 60)    # Disabled buttons
+COLOR_BACKGROUND: Final[ColorType] = (50, 50, 50)           # Main background
+COLOR_PANEL: Final[ColorType] = (70, 70, 70)                # UI panels
+COLOR_BUTTON: Final[ColorType] = (100, 100, 100)            # Default buttons
+COLOR_BUTTON_HOVER: Final[ColorType] = (120, 120, 120)      # Hovered buttons
+COLOR_BUTTON_PRESSED: Final[ColorType] = (80, 80, 80)       # Pressed buttons
+COLOR_BUTTON_DISABLED: Final[ColorType] = (60, 60, 60)      # Disabled buttons
 
 # Text colors
-COLOR_TEXT_PRIMARY = (255, 255, 255)    # Main text
-COLOR_TEXT_SECONDARY = (200, 200, 200)  # Secondary text
-COLOR_TEXT_ACCENT = (0, 255, 255)       # Accent text (cyan)
-COLOR_TEXT_SUCCESS = (0, 255, 0)        # Success messages
-COLOR_TEXT_WARNING = (255, 255, 0)      # Warnings
-COLOR_TEXT_ERROR = (255, 0, 0)          # Errors
+COLOR_TEXT_PRIMARY: Final[ColorType] = (255, 255, 255)      # Main text
+COLOR_TEXT_SECONDARY: Final[ColorType] = (200, 200, 200)    # Secondary text
+COLOR_TEXT_ACCENT: Final[ColorType] = (0, 255, 255)         # Accent text (cyan)
+COLOR_TEXT_SUCCESS: Final[ColorType] = (0, 255, 0)          # Success messages
+COLOR_TEXT_WARNING: Final[ColorType] = (255, 255, 0)        # Warnings
+COLOR_TEXT_ERROR: Final[ColorType] = (255, 0, 0)            # Errors
 
 # Game world colors
-COLOR_PLAY_AREA = (0, 100, 0)           # Play area background
-COLOR_GRID = (0, 120, 0)                # Grid lines (lighter for future roads)
-COLOR_GRID_ROAD = (0, 80, 0)            # Road grid lines (darker when built)
-COLOR_FENCE = (139, 69, 19)             # Fence around play area
-COLOR_CENTER_HUB = (0, 100, 255)        # Central power hub
+COLOR_PLAY_AREA: Final[ColorType] = (0, 100, 0)             # Play area background
+COLOR_GRID: Final[ColorType] = (0, 120, 0)                  # Grid lines (lighter for future roads)
+COLOR_GRID_ROAD: Final[ColorType] = (0, 80, 0)              # Road grid lines (darker when built)
+COLOR_FENCE: Final[ColorType] = (139, 69, 19)               # Fence around play area
+COLOR_CENTER_HUB: Final[ColorType] = (0, 100, 255)          # Central power hub
 
 # Building colors
-COLOR_CELL_ACTIVE = (255, 255, 0)       # Active power cells
-COLOR_CELL_INACTIVE = (128, 128, 0)     # Inactive power cells
-COLOR_BIO_BUILDING = (0, 255, 0)        # BIO generators
-COLOR_TENT_BUILDING = (139, 69, 19)     # Tent homes
-COLOR_STUDY_BUILDING = (0, 0, 255)      # Study facilities
-COLOR_MUSIC_BUILDING = (255, 20, 147)   # Music/happiness buildings
-COLOR_CAMP_BUILDING = (128, 128, 128)   # Training camps
+COLOR_CELL_ACTIVE: Final[ColorType] = (255, 255, 0)         # Active power cells
+COLOR_CELL_INACTIVE: Final[ColorType] = (128, 128, 0)       # Inactive power cells
+COLOR_BIO_BUILDING: Final[ColorType] = (0, 255, 0)          # BIO generators
+COLOR_TENT_BUILDING: Final[ColorType] = (139, 69, 19)       # Tent homes
+COLOR_STUDY_BUILDING: Final[ColorType] = (0, 0, 255)        # Study facilities
+COLOR_MUSIC_BUILDING: Final[ColorType] = (255, 20, 147)     # Music/happiness buildings
+COLOR_CAMP_BUILDING: Final[ColorType] = (128, 128, 128)     # Training camps
 
 # Weather/environment colors
-COLOR_SKY_DAY_CLEAR = (135, 206, 235)   # Clear day sky
-COLOR_SKY_DAY_CLOUDY = (100, 150, 200)  # Cloudy day sky
-COLOR_SKY_DAY_STORM = (70, 100, 150)    # Stormy day sky
-COLOR_SKY_NIGHT_CLEAR = (25, 25, 112)   # Clear night sky
-COLOR_SKY_NIGHT_CLOUDY = (15, 15, 60)   # Cloudy night sky
+COLOR_SKY_DAY_CLEAR: Final[ColorType] = (135, 206, 235)     # Clear day sky
+COLOR_SKY_DAY_CLOUDY: Final[ColorType] = (100, 150, 200)    # Cloudy day sky
+COLOR_SKY_DAY_STORM: Final[ColorType] = (70, 100, 150)      # Stormy day sky
+COLOR_SKY_NIGHT_CLEAR: Final[ColorType] = (25, 25, 112)     # Clear night sky
+COLOR_SKY_NIGHT_CLOUDY: Final[ColorType] = (15, 15, 60)     # Cloudy night sky
 
 # Particle colors
-COLOR_RAIN = (100, 150, 255)            # Rain drops
-COLOR_SNOW = (255, 255, 255)            # Snow flakes
-COLOR_FOG = (200, 200, 200)             # Fog particles
+COLOR_RAIN: Final[ColorType] = (100, 150, 255)              # Rain drops
+COLOR_SNOW: Final[ColorType] = (255, 255, 255)              # Snow flakes
+COLOR_FOG: Final[ColorType] = (200, 200, 200)               # Fog particles
 
 # ============================================================================
 # INPUT SETTINGS
@@ -267,7 +292,7 @@ KEY_REPEAT_INTERVAL = 50        # Milliseconds between repeats
 # ============================================================================
 
 # Rendering
-MAX_PARTICLES = 500             # Maximum particles on screen
+MAX_PARTICLES = 2000            # Maximum particles on screen (caps weather particle columns)
 LOD_DISTANCE = 200              # Level of detail switching distance
 VSYNC_ENABLED = True            # Vertical sync
 FRAME_SKIP_THRESHOLD = 5        # Skip frames if behind this many
@@ -276,6 +301,7 @@ FRAME_SKIP_THRESHOLD = 5        # Skip frames if behind this many
 ASSET_CACHE_SIZE = 100 * 1024 * 1024  # 100MB asset cache
 TEXTURE_COMPRESSION = False     # Enable texture compression
 GARBAGE_COLLECT_INTERVAL = 60.0 # Seconds between garbage collection
+ASSET_PREFETCH_MIN_BYTES = 256 * 1024  # Below this, plain synchronous reads win
 
 # Threading
 USE_BACKGROUND_LOADING = True   # Load assets in background
@@ -294,26 +320,44 @@ DEBUG_SHOW_PATHS = False        # Show movement paths
 DEBUG_VERBOSE_LOGGING = False   # Extra detailed logging
 
 # Debug colors
-COLOR_DEBUG_TEXT = (255, 255, 0)        # Debug text
-COLOR_DEBUG_COLLISION = (255, 0, 255)   # Collision boxes
-COLOR_DEBUG_PATH = (0, 255, 255)        # Movement paths
+COLOR_DEBUG_TEXT: Final[ColorType] = (255, 255, 0)          # Debug text
+COLOR_DEBUG_COLLISION: Final[ColorType] = (255, 0, 255)     # Collision boxes
+COLOR_DEBUG_PATH: Final[ColorType] = (0, 255, 255)          # Movement paths
 
 # ============================================================================
 # FILE PATHS
 # ============================================================================
 
-# Directory paths (relative to SRC folder)
-ASSETS_DIR = "../assets"  # Assets folder is one level up from SRC
-LOGS_DIR = "../logs"
-SAVES_DIR = "../saves"
-CONFIG_DIR = "../config"
-TEMP_DIR = "../temp"
+# Directory paths, resolved once from this file's location
+_BASE: Final[Path] = Path(__file__).resolve().parent
+ASSETS_DIR: Final[Path] = _BASE.parent / "assets"  # Assets folder is one level up from SRC
+LOGS_DIR: Final[Path] = _BASE.parent / "logs"
+SAVES_DIR: Final[Path] = _BASE.parent / "saves"
+CONFIG_DIR: Final[Path] = _BASE.parent / "config"
+TEMP_DIR: Final[Path] = _BASE.parent / "temp"
 
 # Specific file paths
-SETTINGS_FILE = os.path.join(CONFIG_DIR, "settings.ini")
-ASSET_MANIFEST = os.path.join(ASSETS_DIR, "manifest.json")
-DEFAULT_SAVE_FILE = os.path.join(SAVES_DIR, "game.save")
-LOG_FILE = os.path.join(LOGS_DIR, "nanoverse.log")
+SETTINGS_FILE: Final[Path] = CONFIG_DIR / "settings.ini"
+ASSET_MANIFEST: Final[Path] = ASSETS_DIR / "manifest.json"
+ASSET_ATLAS: Final[Path] = ASSETS_DIR / "atlas.png"  # Built by build_atlas.py
+ASSET_ATLAS_INDEX: Final[Path] = ASSETS_DIR / "atlas.json"
+DEFAULT_SAVE_FILE: Final[Path] = SAVES_DIR / "game.save"
+LOG_FILE: Final[Path] = LOGS_DIR / "nanoverse.log"
+DIFFICULTIES_FILE: Final[Path] = CONFIG_DIR / "difficulties.toml"
+
+# Read-only mapping of the manifest, kept open so handed-out views stay valid
+_MANIFEST_MMAP = None
+
+def open_manifest_mmap() -> Optional[memoryview]:
+    """Memory-map the asset manifest; returns None if it is missing or empty"""
+    global _MANIFEST_MMAP
+    if _MANIFEST_MMAP is None:
+        try:
+            with open(ASSET_MANIFEST, 'rb') as f:
+                _MANIFEST_MMAP = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # ValueError: zero-length file
+            return None
+    return memoryview(_MANIFEST_MMAP)
 
 # Asset file names (updated to lowercase)
 NANO_SPRITESHEET = "nanos.png"
@@ -325,6 +369,12 @@ SHACK_TEXTURE = "shack.png"
 SMALL_HOME_TEXTURE = "small_home.png"
 LARGE_HOME_TEXTURE = "large_home.png"
 
+# Images packed into the texture atlas
+ATLAS_TEXTURES = [
+    MOON_TEXTURE, SUN_TEXTURE, POWER_ICON, TENT_TEXTURE,
+    SHACK_TEXTURE, SMALL_HOME_TEXTURE, LARGE_HOME_TEXTURE, NANO_SPRITESHEET
+]
+
 # ============================================================================
 # GAME BALANCE
 # ============================================================================
@@ -341,137 +391,217 @@ DEFLATION_RATE = 0.005          # Daily price decreases
 MARKET_VOLATILITY = 0.1         # Price variation range
 
 # Difficulty scaling
-DIFFICULTY_EASY = {
-    "starting_credits": 2000.0,
-    "work_power_bonus": 0.5,
-    "building_cost_reduction": 0.8
-}
-DIFFICULTY_NORMAL = {
-    "starting_credits": 1000.0,
-    "work_power_bonus": 0.0,
-    "building_cost_reduction": 1.0
-}
-DIFFICULTY_HARD = {
-    "starting_credits": 500.0,
-    "work_power_bonus": -0.2,
-    "building_cost_reduction": 1.2
-}
+class Difficulty(NamedTuple):
+    starting_credits: float
+    work_power_bonus: float
+    building_cost_reduction: float
+
+DIFFICULTY_EASY = Difficulty(starting_credits=2000.0, work_power_bonus=0.5, building_cost_reduction=0.8)
+DIFFICULTY_NORMAL = Difficulty(starting_credits=1000.0, work_power_bonus=0.0, building_cost_reduction=1.0)
+DIFFICULTY_HARD = Difficulty(starting_credits=500.0, work_power_bonus=-0.2, building_cost_reduction=1.2)
+
+DIFFICULTIES: Mapping[str, Difficulty] = MappingProxyType({
+    "easy": DIFFICULTY_EASY,
+    "normal": DIFFICULTY_NORMAL,
+    "hard": DIFFICULTY_HARD
+})
+
+class DifficultyLevel(IntEnum):
+    EASY = 0
+    NORMAL = 1
+    HARD = 2
+
+# Difficulty profiles indexed by DifficultyLevel
+_DIFF_TABLE: Tuple[Difficulty, ...] = (DIFFICULTY_EASY, DIFFICULTY_NORMAL, DIFFICULTY_HARD)
+
+# Lowercase difficulty names -> level
+_DIFF_LEVELS: Dict[str, DifficultyLevel] = {level.name.lower(): level for level in DifficultyLevel}
 
 # ============================================================================
-# VALIDATION FUNCTIONS
+# CONFIG NAMESPACES
 # ============================================================================
 
-def validate_config():
-    """Validate configuration values for consistency"""
-    errors = []
+class DisplayConfig:
+    """Window size plus the layout values derived from it, computed on first read"""
     
+    def __init__(self, window_width: int, window_height: int):
+        self.window_width = window_width
+        self.window_height = window_height
+        
+    @cached_property
+    def play_area_width(self) -> int:
+        """Play area width left between the side panels"""
+        return self.window_width - UI_PANEL_WIDTH - INFO_PANEL_WIDTH - 30
+        
+    @cached_property
+    def play_area_height(self) -> int:
+        """Play area height left between the top and bottom bars"""
+        return self.window_height - TIME_BAR_HEIGHT - STATUS_BAR_HEIGHT - 20
+        
+    @cached_property
+    def play_area_center_x(self) -> int:
+        """Horizontal center of the play area"""
+        return self.play_area_width // 2
+        
+    @cached_property
+    def play_area_center_y(self) -> int:
+        """Vertical center of the play area"""
+        return self.play_area_height // 2
+        
+    def __repr__(self) -> str:
+        return f"DisplayConfig({self.window_width}x{self.window_height})"
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """Configuration values that change while the game is running; replaced, never mutated"""
+    display: DisplayConfig = field(default_factory=lambda: DisplayConfig(WINDOW_WIDTH, WINDOW_HEIGHT))
+    starting_credits: float = STARTING_CREDITS
+    starting_work_power: float = STARTING_WORK_POWER
+    building_costs: Tuple[Tuple[float, float], ...] = BUILDING_COSTS  # Indexed by BuildingKind
+
+# The current runtime config; swapped as a whole so readers on any thread
+# always see one consistent snapshot
+_runtime_config = RuntimeConfig()
+
+def get_runtime_config() -> RuntimeConfig:
+    """Get the current runtime configuration snapshot"""
+    return _runtime_config
+
+def set_runtime_config(rt: RuntimeConfig):
+    """Install a new runtime configuration snapshot"""
+    global _runtime_config
+    _runtime_config = rt
+
+# ============================================================================
+# VALIDATION FUNCTIONS
+# ============================================================================
+
+def _iter_config_errors():
+    """Yield configuration problems lazily, one message per failed check"""
     # Window size validation
     if WINDOW_WIDTH < MIN_WINDOW_WIDTH or WINDOW_WIDTH > MAX_WINDOW_WIDTH:
-        errors.append(f"WINDOW_WIDTH {WINDOW_WIDTH} out of range {MIN_WINDOW_WIDTH}-{MAX_WINDOW_WIDTH}")
+        yield f"WINDOW_WIDTH {WINDOW_WIDTH} out of range {MIN_WINDOW_WIDTH}-{MAX_WINDOW_WIDTH}"
     
     if WINDOW_HEIGHT < MIN_WINDOW_HEIGHT or WINDOW_HEIGHT > MAX_WINDOW_HEIGHT:
-        errors.append(f"WINDOW_HEIGHT {WINDOW_HEIGHT} out of range {MIN_WINDOW_HEIGHT}-{MAX_WINDOW_HEIGHT}")
+        yield f"WINDOW_HEIGHT {WINDOW_HEIGHT} out of range {MIN_WINDOW_HEIGHT}-{MAX_WINDOW_HEIGHT}"
     
     # Grid size validation
     if GRID_SIZE <= 0 or GRID_SIZE > 100:
-        errors.append(f"GRID_SIZE {GRID_SIZE} must be between 1 and 100")
+        yield f"GRID_SIZE {GRID_SIZE} must be between 1 and 100"
     
     # Time validation
     if SECONDS_PER_GAME_HOUR <= 0:
-        errors.append("SECONDS_PER_GAME_HOUR must be positive")
+        yield "SECONDS_PER_GAME_HOUR must be positive"
     
     # Economic validation
     if STARTING_CREDITS < 0:
-        errors.append("STARTING_CREDITS cannot be negative")
+        yield "STARTING_CREDITS cannot be negative"
     
     if MIN_SELL_RATE >= EU_TO_CREDITS_RATE:
-        errors.append("MIN_SELL_RATE must be less than EU_TO_CREDITS_RATE")
+        yield "MIN_SELL_RATE must be less than EU_TO_CREDITS_RATE"
+
+def validate_config():
+    """Validate configuration values for consistency"""
+    return list(_iter_config_errors())
+
+def _load_difficulty_file(name: str, bundled: Difficulty) -> Difficulty:
+    """Read one profile from DIFFICULTIES_FILE, filling gaps from the bundled profile"""
+    try:
+        import tomllib  # Python 3.11+
+        with open(DIFFICULTIES_FILE, 'rb') as f:
+            entry = tomllib.load(f).get(name, {})
+        return Difficulty(*(float(entry.get(key, value)) for key, value in zip(Difficulty._fields, bundled)))
+    except (ImportError, OSError, ValueError, TypeError, AttributeError):  # No parser, no file, or bad data
+        return bundled
+
+@lru_cache(maxsize=8)
+def _difficulty_settings(level: DifficultyLevel) -> Difficulty:
+    """Load one level's settings; keyed on the level so every spelling shares an entry"""
+    return _load_difficulty_file(level.name.lower(), _DIFF_TABLE[level])
+
+def get_difficulty_settings(difficulty) -> Difficulty:
+    """Get settings for a DifficultyLevel or its name, loading the data file on first use"""
+    if not isinstance(difficulty, DifficultyLevel):
+        difficulty = _DIFF_LEVELS.get(difficulty.lower(), DifficultyLevel.NORMAL)
+    return _difficulty_settings(difficulty)
+
+# Built once; get_color_palette hands out this read-only view
+_COLOR_PALETTE: Mapping[str, ColorType] = MappingProxyType({
+    # UI Colors
+    'background': COLOR_BACKGROUND,
+    'panel': COLOR_PANEL,
+    'button': COLOR_BUTTON,
+    'button_hover': COLOR_BUTTON_HOVER,
+    'button_pressed': COLOR_BUTTON_PRESSED,
+    'button_disabled': COLOR_BUTTON_DISABLED,
     
-    return errors
-
-def get_difficulty_settings(difficulty: str) -> Dict[str, Any]:
-    """Get settings for specified difficulty level"""
-    difficulties = {
-        "easy": DIFFICULTY_EASY,
-        "normal": DIFFICULTY_NORMAL,
-        "hard": DIFFICULTY_HARD
-    }
-    return difficulties.get(difficulty.lower(), DIFFICULTY_NORMAL)
-
-def get_color_palette() -> Dict[str, Tuple[int, int, int]]:
-    """Get all colors as a dictionary for easy access"""
-    return {
-        # UI Colors
-        'background': COLOR_BACKGROUND,
-        'panel': COLOR_PANEL,
-        'button': COLOR_BUTTON,
-        'button_hover': COLOR_BUTTON_HOVER,
-        'button_pressed': COLOR_BUTTON_PRESSED,
-        'button_disabled': COLOR_BUTTON_DISABLED,
-        
-        # Text Colors
-        'text_primary': COLOR_TEXT_PRIMARY,
-        'text_secondary': COLOR_TEXT_SECONDARY,
-        'text_accent': COLOR_TEXT_ACCENT,
-        'text_success': COLOR_TEXT_SUCCESS,
-        'text_warning': COLOR_TEXT_WARNING,
-        'text_error': COLOR_TEXT_ERROR,
-        
-        # World Colors
-        'play_area': COLOR_PLAY_AREA,
-        'grid': COLOR_GRID,
-        'fence': COLOR_FENCE,
-        'center_hub': COLOR_CENTER_HUB,  # Fixed: was COLOR_CENTER_SQUARE
-        
-        # Building Colors
-        'cell_active': COLOR_CELL_ACTIVE,
-        'cell_inactive': COLOR_CELL_INACTIVE,
-        'bio_building': COLOR_BIO_BUILDING,
-        'tent_building': COLOR_TENT_BUILDING,
-        'study_building': COLOR_STUDY_BUILDING,
-        'music_building': COLOR_MUSIC_BUILDING,
-        'camp_building': COLOR_CAMP_BUILDING
-    }
+    # Text Colors
+    'text_primary': COLOR_TEXT_PRIMARY,
+    'text_secondary': COLOR_TEXT_SECONDARY,
+    'text_accent': COLOR_TEXT_ACCENT,
+    'text_success': COLOR_TEXT_SUCCESS,
+    'text_warning': COLOR_TEXT_WARNING,
+    'text_error': COLOR_TEXT_ERROR,
+    
+    # World Colors
+    'play_area': COLOR_PLAY_AREA,
+    'grid': COLOR_GRID,
+    'fence': COLOR_FENCE,
+    'center_hub': COLOR_CENTER_HUB,  # Fixed: was COLOR_CENTER_SQUARE
+    
+    # Building Colors
+    'cell_active': COLOR_CELL_ACTIVE,
+    'cell_inactive': COLOR_CELL_INACTIVE,
+    'bio_building': COLOR_BIO_BUILDING,
+    'tent_building': COLOR_TENT_BUILDING,
+    'study_building': COLOR_STUDY_BUILDING,
+    'music_building': COLOR_MUSIC_BUILDING,
+    'camp_building': COLOR_CAMP_BUILDING
+})
+
+def get_color_palette() -> Mapping[str, ColorType]:
+    """Get all colors as a read-only mapping for easy access"""
+    return _COLOR_PALETTE
 
 # ============================================================================
 # RUNTIME CONFIG UPDATES
 # ============================================================================
 
-def update_display_config(width: int, height: int):
-    """Update display-dependent configuration values"""
-    global WINDOW_WIDTH, WINDOW_HEIGHT, PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT
-    global PLAY_AREA_CENTER_X, PLAY_AREA_CENTER_Y
-    
-    WINDOW_WIDTH = max(MIN_WINDOW_WIDTH, min(MAX_WINDOW_WIDTH, width))
-    WINDOW_HEIGHT = max(MIN_WINDOW_HEIGHT, min(MAX_WINDOW_HEIGHT, height))
-    
-    PLAY_AREA_WIDTH = WINDOW_WIDTH - UI_PANEL_WIDTH - INFO_PANEL_WIDTH - 30
-    PLAY_AREA_HEIGHT = WINDOW_HEIGHT - TIME_BAR_HEIGHT - STATUS_BAR_HEIGHT - 20
-    PLAY_AREA_CENTER_X = PLAY_AREA_WIDTH // 2
-    PLAY_AREA_CENTER_Y = PLAY_AREA_HEIGHT // 2
-
-def apply_difficulty_settings(difficulty: str):
-    """Apply difficulty settings to game configuration"""
-    global STARTING_CREDITS, STARTING_WORK_POWER
-    
+def update_display_config(rt: RuntimeConfig, width: int, height: int) -> RuntimeConfig:
+    """Return a copy of rt with a new (clamped) window size; layout values derive lazily"""
+    display = DisplayConfig(
+        max(MIN_WINDOW_WIDTH, min(MAX_WINDOW_WIDTH, width)),
+        max(MIN_WINDOW_HEIGHT, min(MAX_WINDOW_HEIGHT, height))
+    )
+    return dataclasses.replace(rt, display=display)
+
+def apply_difficulty_settings(rt: RuntimeConfig, difficulty: str) -> RuntimeConfig:
+    """Return a copy of rt with a difficulty applied to the base economy values"""
     settings = get_difficulty_settings(difficulty)
-    STARTING_CREDITS = settings.get("starting_credits", STARTING_CREDITS)
-    
-    # Apply work power bonus
-    work_bonus = settings.get("work_power_bonus", 0.0)
-    STARTING_WORK_POWER = max(0.01, STARTING_WORK_POWER + work_bonus)
     
     # Apply building cost modifier
-    cost_modifier = settings.get("building_cost_reduction", 1.0)
-    for building_type in BUILDING_COSTS:
-        eu_cost, credit_cost = BUILDING_COSTS[building_type]
-        BUILDING_COSTS[building_type] = (eu_cost * cost_modifier, credit_cost * cost_modifier)
-
-# Run validation on import
-_config_errors = validate_config()
-if _config_errors:
-    print("Configuration validation errors:")
-    for error in _config_errors:
-        print(f"  - {error}")
+    cost_modifier = settings.building_cost_reduction
+    return dataclasses.replace(
+        rt,
+        starting_credits=settings.starting_credits,
+        starting_work_power=max(0.01, STARTING_WORK_POWER + settings.work_power_bonus),
+        building_costs=tuple(
+            (eu_cost * cost_modifier, credit_cost * cost_modifier)
+            for eu_cost, credit_cost in BUILDING_COSTS
+        )
+    )
+
+def building_cost(kind, rt: Optional[RuntimeConfig] = None) -> Tuple[float, float]:
+    """Get the current (EU, credits) cost for a BuildingKind or its name"""
+    index = BUILDING_KIND_INDEX[kind] if isinstance(kind, str) else int(kind)
+    return (rt or _runtime_config).building_costs[index]
+
+# Run validation on import (compiled out under python -O); errors go out as
+# one log record rather than a print per line
+_log = logging.getLogger("nanoverse.config")
+if __debug__:
+    _config_errors = validate_config()
+    if _config_errors:
+        _log.warning("Configuration validation errors:\n  - %s", "\n  - ".join(_config_errors))
 
 #EOF config.py # 495 lines
@@ -8,7 +8,8 @@ weather systems, environmental effects, and world simulation.
 import pygame
 import random
 import math
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, List, Dict, Mapping, Optional, Tuple
+from types import MappingProxyType
 from enum import Enum
 from models import *
 from config import *
@@ -36,8 +37,74 @@ class EnvironmentalEffect(Enum):
     PRODUCTIVITY_BOOST = "productivity_boost"
     PRODUCTIVITY_REDUCTION = "productivity_reduction"
 
+class _EFF:
+    """Bit values of each EnvironmentalEffect inside an effect mask"""
+    SOLAR_BOOST = 1
+    SOLAR_REDUCTION = 2
+    ENERGY_DRAIN = 4
+    HAPPINESS_BOOST = 8
+    HAPPINESS_REDUCTION = 16
+    PRODUCTIVITY_BOOST = 32
+    PRODUCTIVITY_REDUCTION = 64
+
+def _build_weather_effect_masks() -> Dict[Tuple["WeatherType", bool, bool], int]:
+    """Precompute the active effect mask for every (weather, daytime, intense) combination"""
+    masks = {}
+    for weather in WeatherType:
+        for is_day in (False, True):
+            for intense in (False, True):
+                if weather == WeatherType.CLEAR:
+                    mask = _EFF.SOLAR_BOOST | _EFF.HAPPINESS_BOOST if is_day else 0
+                elif weather == WeatherType.CLOUDY:
+                    mask = _EFF.SOLAR_REDUCTION
+                elif weather == WeatherType.RAIN:
+                    mask = _EFF.SOLAR_REDUCTION | _EFF.HAPPINESS_REDUCTION
+                    if intense:
+                        mask |= _EFF.PRODUCTIVITY_REDUCTION
+                elif weather == WeatherType.STORM:
+                    mask = (_EFF.SOLAR_REDUCTION | _EFF.ENERGY_DRAIN |
+                            _EFF.HAPPINESS_REDUCTION | _EFF.PRODUCTIVITY_REDUCTION)
+                elif weather == WeatherType.FOG:
+                    mask = _EFF.SOLAR_REDUCTION | _EFF.PRODUCTIVITY_REDUCTION
+                elif weather == WeatherType.SNOW:
+                    mask = _EFF.SOLAR_REDUCTION | _EFF.HAPPINESS_REDUCTION | _EFF.ENERGY_DRAIN
+                else:
+                    mask = 0
+                masks[(weather, is_day, intense)] = mask
+    return masks
+
+_WEATHER_EFFECT_MASKS = _build_weather_effect_masks()
+
+# Settled sky color per (is_day, weather)
+_SKY_COLORS = {
+    (True, WeatherType.CLEAR): (135, 206, 235),   # Sky blue
+    (True, WeatherType.CLOUDY): (100, 150, 200),  # Cloudy blue
+    (True, WeatherType.RAIN): (70, 100, 150),     # Storm blue
+    (True, WeatherType.STORM): (70, 100, 150),    # Storm blue
+    (True, WeatherType.FOG): (150, 150, 150),     # Grey
+    (True, WeatherType.SNOW): (200, 200, 220),    # Snowy grey
+    (False, WeatherType.CLEAR): (25, 25, 112),    # Midnight blue
+    (False, WeatherType.CLOUDY): (15, 15, 60),    # Dark night
+    (False, WeatherType.RAIN): (15, 15, 60),
+    (False, WeatherType.STORM): (15, 15, 60),
+    (False, WeatherType.FOG): (15, 15, 60),
+    (False, WeatherType.SNOW): (15, 15, 60)
+}
+
+# Ambient light multiplier per weather (missing = 1.0)
+_LIGHT_MULT = {
+    WeatherType.STORM: 0.6,
+    WeatherType.RAIN: 0.8,
+    WeatherType.FOG: 0.7,
+    WeatherType.SNOW: 0.9
+}
+
 class WeatherSystem:
     """Manages weather patterns and their effects on the game"""
+    __slots__ = ('current_weather', 'weather_intensity', 'weather_duration', 'weather_change_timer',
+                 'weather_change_interval', 'transitioning', 'transition_progress', 'next_weather',
+                 'active_effects_mask', 'weather_patterns', '_seasonal_patterns', '_seasonal_cdf_cache',
+                 '_modifier_intensity', '_solar_mod', '_prod_mod', '_happy_mod', '_energy_drain')
     
     def __init__(self):
         self.current_weather = WeatherType.CLEAR
@@ -51,8 +118,11 @@ class WeatherSystem:
         self.transition_progress = 0.0
         self.next_weather = None
         
-        # Weather effects
-        self.active_effects = []
+        # Weather effects (bitmask of _EFF values)
+        self.active_effects_mask = 0
+        
+        # Modifiers derived from the effects, refreshed by update_effects
+        self._refresh_modifiers()
         
         # Weather patterns (probability weights)
         self.weather_patterns = {
@@ -64,6 +134,15 @@ class WeatherSystem:
             WeatherType.SNOW: 0.02
         }
         
+        # Seasonal patterns never change, so compute all four once
+        # (rebuild these and clear the CDF cache if weather_patterns is changed)
+        self._seasonal_patterns = {
+            season: MappingProxyType(self._compute_seasonal(season)) for season in SeasonType
+        }
+        
+        # Cumulative weight tables per season, built on first use
+        self._seasonal_cdf_cache: Dict[SeasonType, Tuple[List[WeatherType], List[float], float]] = {}
+        
     def update(self, dt: float, game_hour: int, season: SeasonType):
         """Update weather system"""
         self.weather_duration += dt
@@ -89,26 +168,45 @@ class WeatherSystem:
         
     def change_weather(self, season: SeasonType):
         """Change to new weather based on season"""
-        # Adjust weather patterns based on season
+        weathers, cumulative, total_weight = self.get_seasonal_cdf(season)
+        if total_weight <= 0.0:
+            return
+            
+        # Don't change to same weather: resample a few times instead of rebuilding the table
+        for weather in random.choices(weathers, cum_weights=cumulative, k=3):
+            if weather != self.current_weather:
+                self.start_transition(weather)
+                return
+                
+        # Current weather dominates the table; pick from the rest directly
         seasonal_patterns = self.get_seasonal_patterns(season)
-        
-        # Don't change to same weather
-        available_weather = {w: p for w, p in seasonal_patterns.items() 
-                           if w != self.current_weather}
-        
+        available_weather = [w for w, p in seasonal_patterns.items() 
+                             if w != self.current_weather and p > 0.0]
         if available_weather:
-            total_weight = sum(available_weather.values())
-            rand_val = random.random() * total_weight
+            weights = [seasonal_patterns[w] for w in available_weather]
+            self.start_transition(random.choices(available_weather, weights=weights, k=1)[0])
             
-            cumulative = 0.0
-            for weather, weight in available_weather.items():
-                cumulative += weight
-                if rand_val <= cumulative:
-                    self.start_transition(weather)
-                    break
-                    
-    def get_seasonal_patterns(self, season: SeasonType) -> Dict[WeatherType, float]:
-        """Get weather patterns adjusted for season"""
+    def get_seasonal_cdf(self, season: SeasonType) -> Tuple[List[WeatherType], List[float], float]:
+        """Get (weathers, cumulative weights, total weight) for a season"""
+        cdf = self._seasonal_cdf_cache.get(season)
+        if cdf is None:
+            weathers = []
+            cumulative = []
+            total_weight = 0.0
+            for weather, weight in self.get_seasonal_patterns(season).items():
+                total_weight += weight
+                weathers.append(weather)
+                cumulative.append(total_weight)
+            cdf = (weathers, cumulative, total_weight)
+            self._seasonal_cdf_cache[season] = cdf
+        return cdf
+        
+    def get_seasonal_patterns(self, season: SeasonType) -> Mapping[WeatherType, float]:
+        """Get weather patterns adjusted for season (read-only, shared between callers)"""
+        return self._seasonal_patterns[season]
+        
+    def _compute_seasonal(self, season: SeasonType) -> Dict[WeatherType, float]:
+        """Compute weather patterns adjusted for season"""
         patterns = self.weather_patterns.copy()
         
         if season == SeasonType.SPRING:
@@ -147,81 +245,83 @@ class WeatherSystem:
         
     def update_effects(self, dt: float, game_hour: int):
         """Update active weather effects"""
-        self.active_effects.clear()
+        mask = _WEATHER_EFFECT_MASKS[
+            (self.current_weather, 6 <= game_hour <= 18, self.weather_intensity > 0.7)
+        ]
         
-        # Apply weather-specific effects
-        if self.current_weather == WeatherType.CLEAR:
-            if 6 <= game_hour <= 18:  # Daytime
-                self.active_effects.append(EnvironmentalEffect.SOLAR_BOOST)
-                self.active_effects.append(EnvironmentalEffect.HAPPINESS_BOOST)
-                
-        elif self.current_weather == WeatherType.CLOUDY:
-            self.active_effects.append(EnvironmentalEffect.SOLAR_REDUCTION)
+        # Modifiers only depend on the mask and intensity, so refresh them on change
+        if mask != self.active_effects_mask or self.weather_intensity != self._modifier_intensity:
+            self.active_effects_mask = mask
+            self._refresh_modifiers()
             
-        elif self.current_weather == WeatherType.RAIN:
-            self.active_effects.append(EnvironmentalEffect.SOLAR_REDUCTION)
-            self.active_effects.append(EnvironmentalEffect.HAPPINESS_REDUCTION)
-            if self.weather_intensity > 0.7:
-                self.active_effects.append(EnvironmentalEffect.PRODUCTIVITY_REDUCTION)
-                
-        elif self.current_weather == WeatherType.STORM:
-            self.active_effects.append(EnvironmentalEffect.SOLAR_REDUCTION)
-            self.active_effects.append(EnvironmentalEffect.ENERGY_DRAIN)
-            self.active_effects.append(EnvironmentalEffect.HAPPINESS_REDUCTION)
-            self.active_effects.append(EnvironmentalEffect.PRODUCTIVITY_REDUCTION)
+    def _refresh_modifiers(self):
+        """Recompute the cached modifiers from the effect mask and intensity"""
+        mask = self.active_effects_mask
+        intensity = self.weather_intensity
+        self._modifier_intensity = intensity
+        
+        if mask & _EFF.SOLAR_BOOST:
+            self._solar_mod = 1.5
+        elif mask & _EFF.SOLAR_REDUCTION:
+            self._solar_mod = max(0.1, 1.0 - intensity * 0.8)
+        else:
+            self._solar_mod = 1.0
+            
+        if mask & _EFF.PRODUCTIVITY_BOOST:
+            self._prod_mod = 1.2
+        elif mask & _EFF.PRODUCTIVITY_REDUCTION:
+            self._prod_mod = max(0.5, 1.0 - intensity * 0.4)
+        else:
+            self._prod_mod = 1.0
             
-        elif self.current_weather == WeatherType.FOG:
-            self.active_effects.append(EnvironmentalEffect.SOLAR_REDUCTION)
-            self.active_effects.append(EnvironmentalEffect.PRODUCTIVITY_REDUCTION)
+        if mask & _EFF.HAPPINESS_BOOST:
+            self._happy_mod = 0.5
+        elif mask & _EFF.HAPPINESS_REDUCTION:
+            self._happy_mod = -intensity * 1.0
+        else:
+            self._happy_mod = 0.0
             
-        elif self.current_weather == WeatherType.SNOW:
-            self.active_effects.append(EnvironmentalEffect.SOLAR_REDUCTION)
-            self.active_effects.append(EnvironmentalEffect.HAPPINESS_REDUCTION)
-            self.active_effects.append(EnvironmentalEffect.ENERGY_DRAIN)
+        if mask & _EFF.ENERGY_DRAIN:
+            self._energy_drain = intensity * 0.1  # EU per hour
+        else:
+            self._energy_drain = 0.0
+        
+    @property
+    def active_effects(self) -> List[EnvironmentalEffect]:
+        """Get active weather effects as a list (built on demand from the mask)"""
+        mask = self.active_effects_mask
+        return [effect for effect in EnvironmentalEffect
+                if mask & getattr(_EFF, effect.name)]
             
     def get_solar_modifier(self) -> float:
         """Get solar power generation modifier"""
-        modifier = 1.0
-        
-        if EnvironmentalEffect.SOLAR_BOOST in self.active_effects:
-            modifier *= 1.5
-        elif EnvironmentalEffect.SOLAR_REDUCTION in self.active_effects:
-            modifier *= max(0.1, 1.0 - self.weather_intensity * 0.8)
-            
-        return modifier
+        return self._solar_mod
         
     def get_productivity_modifier(self) -> float:
         """Get nano productivity modifier"""
-        modifier = 1.0
-        
-        if EnvironmentalEffect.PRODUCTIVITY_BOOST in self.active_effects:
-            modifier *= 1.2
-        elif EnvironmentalEffect.PRODUCTIVITY_REDUCTION in self.active_effects:
-            modifier *= max(0.5, 1.0 - self.weather_intensity * 0.4)
-            
-        return modifier
+        return self._prod_mod
         
     def get_happiness_modifier(self) -> float:
         """Get nano happiness modifier"""
-        modifier = 0.0
-        
-        if EnvironmentalEffect.HAPPINESS_BOOST in self.active_effects:
-            modifier += 0.5
-        elif EnvironmentalEffect.HAPPINESS_REDUCTION in self.active_effects:
-            modifier -= self.weather_intensity * 1.0
-            
-        return modifier
+        return self._happy_mod
         
     def get_energy_drain_rate(self) -> float:
         """Get additional energy drain rate"""
-        if EnvironmentalEffect.ENERGY_DRAIN in self.active_effects:
-            return self.weather_intensity * 0.1  # EU per hour
-        return 0.0
+        return self._energy_drain
 
 class TimeSystem:
     """Manages game time, seasons, and day/night cycles"""
+    __slots__ = ('sunrise_hour', 'sunset_hour', '_day_duration', '_night_duration', '_game_hour',
+                 '_is_day', 'game_day', 'game_month', 'game_year', 'time_accumulator', 'day_length',
+                 'speed_multiplier', 'seasons')
     
     def __init__(self):
+        # Day/night cycle
+        self.sunrise_hour = 6
+        self.sunset_hour = 18
+        self._day_duration = self.sunset_hour - self.sunrise_hour
+        self._night_duration = 24 - self._day_duration
+        
         self.game_hour = 0  # 0-23
         self.game_day = 0
         self.game_month = 0  # 0-11
@@ -239,37 +339,40 @@ class TimeSystem:
             SeasonType.WINTER   # Months 9-11
         ]
         
-        # Day/night cycle
-        self.sunrise_hour = 6
-        self.sunset_hour = 18
+    @property
+    def game_hour(self) -> int:
+        return self._game_hour
+        
+    @game_hour.setter
+    def game_hour(self, hour: int):
+        # Daytime only changes with the hour, so derive it here rather than per query
+        self._game_hour = hour
+        self._is_day = self.sunrise_hour <= hour < self.sunset_hour
         
     def update(self, dt: float):
         """Update time system"""
         self.time_accumulator += dt * self.speed_multiplier
         
-        # Check for hour advancement
-        hours_per_second = 24.0 / self.day_length
-        while self.time_accumulator >= 1.0 / hours_per_second:
-            self.time_accumulator -= 1.0 / hours_per_second
-            self.advance_hour()
+        # Advance all elapsed hours at once, however large dt was
+        seconds_per_hour = self.day_length / 24.0
+        if self.time_accumulator >= seconds_per_hour:
+            hours, self.time_accumulator = divmod(self.time_accumulator, seconds_per_hour)
+            self.advance_hours(int(hours))
             
     def advance_hour(self):
         """Advance game time by one hour"""
-        self.game_hour += 1
+        self.advance_hours(1)
         
-        if self.game_hour >= 24:
-            self.game_hour = 0
-            self.game_day += 1
-            
+    def advance_hours(self, hours: int):
+        """Advance game time by a number of hours, carrying into days, months and years"""
+        days, self.game_hour = divmod(self.game_hour + hours, 24)
+        if days:
             # Check for month advancement (30 days per month)
-            if self.game_day >= 30:
-                self.game_day = 0
-                self.game_month += 1
-                
+            months, self.game_day = divmod(self.game_day + days, 30)
+            if months:
                 # Check for year advancement
-                if self.game_month >= 12:
-                    self.game_month = 0
-                    self.game_year += 1
+                years, self.game_month = divmod(self.game_month + months, 12)
+                self.game_year += years
                     
     def get_current_season(self) -> SeasonType:
         """Get current season based on month"""
@@ -277,26 +380,19 @@ class TimeSystem:
         
     def is_daytime(self) -> bool:
         """Check if it's currently daytime"""
-        return self.sunrise_hour <= self.game_hour < self.sunset_hour
+        return self._is_day
         
     def get_sun_moon_position(self) -> float:
         """Get sun/moon position across sky (0.0 to 1.0)"""
-        if self.is_daytime():
+        if self._is_day:
             # Sun position during day
-            day_progress = (self.game_hour - self.sunrise_hour) / (self.sunset_hour - self.sunrise_hour)
-            return max(0.0, min(1.0, day_progress))
-        else:
-            # Moon position during night
-            if self.game_hour >= self.sunset_hour:
-                night_hour = self.game_hour - self.sunset_hour
-            else:
-                night_hour = self.game_hour + (24 - self.sunset_hour)
-            night_duration = 24 - (self.sunset_hour - self.sunrise_hour)
-            return max(0.0, min(1.0, night_hour / night_duration))
+            return (self._game_hour - self.sunrise_hour) / self._day_duration
+        # Moon position during night (wraps past midnight)
+        return ((self._game_hour - self.sunset_hour) % 24) / self._night_duration
             
     def get_light_level(self) -> float:
         """Get current light level (0.0 to 1.0)"""
-        if self.is_daytime():
+        if self._is_day:
             # Full light during day
             return 1.0
         else:
@@ -311,86 +407,138 @@ class TimeSystem:
         """Get current season as string"""
         return self.get_current_season().value.title()
 
-class EnvironmentalParticle:
-    """Represents environmental particles (rain, snow, etc.)"""
+# Spawn parameters per particle type:
+# (velocity_y range, velocity_x range, life range, size range, color, gravity)
+_PARTICLE_PARAMS = {
+    "rain": ((100, 200), (-20, 20), (3.0, 6.0), (1, 2), (100, 150, 255), 0.0),
+    "snow": ((20, 50), (-10, 10), (8.0, 15.0), (2, 4), (255, 255, 255), 10.0),
+    "fog": ((-5, 5), (-30, 30), (10.0, 20.0), (10, 20), (200, 200, 200), 0.0)
+}
+
+class EnvironmentalEvent:
+    """A special timed environmental event (solar flare, magnetic storm, etc.)"""
+    __slots__ = ('type', 'duration', 'intensity', 'timer')
     
-    def __init__(self, x: float, y: float, particle_type: str):
-        self.x = x
-        self.y = y
-        self.type = particle_type
-        self.velocity_x = 0.0
-        self.velocity_y = 0.0
-        self.life = 1.0
-        self.size = 1.0
-        self.color = (255, 255, 255)
-        self.gravity = 0.0
-        
-        # Initialize based on type
-        if particle_type == "rain":
-            self.velocity_y = random.uniform(100, 200)
-            self.velocity_x = random.uniform(-20, 20)
-            self.life = random.uniform(3.0, 6.0)
-            self.color = (100, 150, 255)
-            self.size = random.uniform(1, 2)
-            
-        elif particle_type == "snow":
-            self.velocity_y = random.uniform(20, 50)
-            self.velocity_x = random.uniform(-10, 10)
-            self.life = random.uniform(8.0, 15.0)
-            self.color = (255, 255, 255)
-            self.size = random.uniform(2, 4)
-            self.gravity = 10.0
-            
-        elif particle_type == "fog":
-            self.velocity_y = random.uniform(-5, 5)
-            self.velocity_x = random.uniform(-30, 30)
-            self.life = random.uniform(10.0, 20.0)
-            self.color = (200, 200, 200)
-            self.size = random.uniform(10, 20)
-            
-    def update(self, dt: float):
-        """Update particle"""
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
-        self.velocity_y += self.gravity * dt
-        self.life -= dt
-        
-        # Fade out over time
-        if self.life < 1.0:
-            alpha = max(0, self.life)
-            self.color = (*self.color[:3], int(255 * alpha))
+    def __init__(self, event_type: str, duration: float, intensity: float):
+        self.type = event_type
+        self.duration = duration
+        self.intensity = intensity
+        self.timer = 0.0
+
+def _apply_solar_flare(game_state, event: EnvironmentalEvent, dt: float):
+    """Boost energy generation"""
+    game_state.resources.work_power *= (1.0 + event.intensity * 0.5)
+
+def _apply_magnetic_storm(game_state, event: EnvironmentalEvent, dt: float):
+    """Drain energy"""
+    drain = event.intensity * 0.5 * dt
+    game_state.resources.surge_capacitor = max(0, 
+        game_state.resources.surge_capacitor - drain)
+
+def _apply_meteor_shower(game_state, event: EnvironmentalEvent, dt: float):
+    """Random resource bonus"""
+    if random.random() < 0.1:  # 10% chance per second
+        game_state.resources.add_eu(event.intensity * 0.1)
+
+# Per-tick effect of each event type; types without an entry (aurora) are cosmetic
+_EVENT_HANDLERS: Dict[str, Callable[[Any, EnvironmentalEvent, float], None]] = {
+    "solar_flare": _apply_solar_flare,
+    "magnetic_storm": _apply_magnetic_storm,
+    "meteor_shower": _apply_meteor_shower
+}
+
+# Particle kind codes stored in ParticleSystem.kinds
+PARTICLE_RAIN = 0
+PARTICLE_SNOW = 1
+PARTICLE_FOG = 2
+_PARTICLE_KINDS = {"rain": PARTICLE_RAIN, "snow": PARTICLE_SNOW, "fog": PARTICLE_FOG}
 
 class ParticleSystem:
-    """Manages environmental particle effects"""
+    """Manages environmental particle effects, stored as parallel per-field lists"""
+    __slots__ = ('xs', 'ys', 'velocities_x', 'velocities_y', 'lives', 'sizes', 'gravities', 'kinds',
+                 'colors', 'spawn_timer', 'screen_width', 'screen_height',
+                 '_fog_sprites', '_snow_sprites')
     
     def __init__(self):
-        self.particles = []
+        # One entry per live particle at the same index in every column
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+        self.velocities_x: List[float] = []
+        self.velocities_y: List[float] = []
+        self.lives: List[float] = []
+        self.sizes: List[float] = []
+        self.gravities: List[float] = []
+        self.kinds: List[int] = []
+        self.colors: List[Tuple[int, int, int]] = []
+        
         self.spawn_timer = 0.0
         self.screen_width = WINDOW_WIDTH
         self.screen_height = WINDOW_HEIGHT
         
+        # Pre-drawn particle sprites keyed by integer radius
+        self._fog_sprites: Dict[int, pygame.Surface] = {}
+        self._snow_sprites: Dict[int, pygame.Surface] = {}
+        
+    def __len__(self) -> int:
+        return len(self.xs)
+        
     def update(self, dt: float, weather: WeatherSystem, screen_width: int, screen_height: int):
         """Update particle system"""
         self.screen_width = screen_width
         self.screen_height = screen_height
+        spawn_rate = self.get_spawn_rate(weather)
         
-        # Update existing particles
-        for particle in self.particles[:]:
-            particle.update(dt)
+        # Nothing to move and nothing to spawn (clear or cloudy weather)
+        if not self.xs and spawn_rate == 0.0:
+            self.spawn_timer = 0.0
+            return
+            
+        # Update existing particles column by column
+        xs = self.xs
+        ys = self.ys
+        velocities_x = self.velocities_x
+        velocities_y = self.velocities_y
+        lives = self.lives
+        gravities = self.gravities
+        max_x = screen_width + 50
+        max_y = screen_height + 50
+        
+        columns = (xs, ys, velocities_x, velocities_y, lives,
+                   self.sizes, gravities, self.kinds, self.colors)
+        
+        i = 0
+        count = len(xs)
+        while i < count:
+            velocity_y = velocities_y[i]
+            x = xs[i] + velocities_x[i] * dt
+            y = ys[i] + velocity_y * dt
+            life = lives[i] - dt
             
-            # Remove dead particles or those off screen
-            if (particle.life <= 0 or 
-                particle.x < -50 or particle.x > screen_width + 50 or
-                particle.y < -50 or particle.y > screen_height + 50):
-                self.particles.remove(particle)
+            # Keep particles that are alive and on screen
+            if life > 0 and -50 <= x <= max_x and -50 <= y <= max_y:
+                xs[i] = x
+                ys[i] = y
+                velocities_y[i] = velocity_y + gravities[i] * dt
+                lives[i] = life
+                i += 1
+                continue
+                
+            # Dead: move the last (not yet updated) particle into this slot and
+            # revisit the slot; every removal is O(1) and nothing is reallocated
+            count -= 1
+            for column in columns:
+                column[i] = column[count]
+                column.pop()
                 
         # Spawn new particles based on weather
         self.spawn_timer += dt
-        spawn_rate = self.get_spawn_rate(weather)
         
-        if spawn_rate > 0 and self.spawn_timer >= 1.0 / spawn_rate:
-            self.spawn_timer = 0.0
-            self.spawn_particle(weather)
+        # Spawn every particle due this tick in one batch, carrying the remainder over
+        if spawn_rate > 0:
+            spawn_count = int(self.spawn_timer * spawn_rate)
+            if spawn_count > 0:
+                self.spawn_timer -= spawn_count / spawn_rate
+                self.spawn_particles(weather, spawn_count)
             
     def get_spawn_rate(self, weather: WeatherSystem) -> float:
         """Get particle spawn rate based on weather"""
@@ -404,53 +552,114 @@ class ParticleSystem:
             return weather.weather_intensity * 5
         return 0.0
         
-    def spawn_particle(self, weather: WeatherSystem):
-        """Spawn a new particle"""
-        x = random.uniform(-50, self.screen_width + 50)
-        y = -50  # Start above screen
-        
-        if weather.current_weather == WeatherType.RAIN:
-            particle = EnvironmentalParticle(x, y, "rain")
-        elif weather.current_weather == WeatherType.STORM:
-            particle = EnvironmentalParticle(x, y, "rain")
-            particle.velocity_y *= 1.5  # Faster rain
-            particle.velocity_x *= 2.0  # More wind
-        elif weather.current_weather == WeatherType.SNOW:
-            particle = EnvironmentalParticle(x, y, "snow")
-        elif weather.current_weather == WeatherType.FOG:
-            x = random.uniform(0, self.screen_width)
-            y = random.uniform(0, self.screen_height)
-            particle = EnvironmentalParticle(x, y, "fog")
+    def spawn_particles(self, weather: WeatherSystem, count: int):
+        """Spawn a batch of new particles straight into the columns"""
+        count = min(count, MAX_PARTICLES - len(self.xs))
+        if count <= 0:
+            return
+            
+        current = weather.current_weather
+        if current == WeatherType.RAIN or current == WeatherType.STORM:
+            particle_type = "rain"
+        elif current == WeatherType.SNOW:
+            particle_type = "snow"
+        elif current == WeatherType.FOG:
+            particle_type = "fog"
         else:
             return
             
-        self.particles.append(particle)
+        (vy_lo, vy_hi), (vx_lo, vx_hi), (life_lo, life_hi), (size_lo, size_hi), color, gravity = \
+            _PARTICLE_PARAMS[particle_type]
+        if current == WeatherType.STORM:
+            # Faster rain, more wind
+            vy_lo, vy_hi = vy_lo * 1.5, vy_hi * 1.5
+            vx_lo, vx_hi = vx_lo * 2.0, vx_hi * 2.0
+            
+        # Fill each column in one pass rather than building a particle per spawn
+        uniform = random.uniform
+        spawns = range(count)
+        if particle_type == "fog":
+            self.xs.extend([uniform(0, self.screen_width) for _ in spawns])
+            self.ys.extend([uniform(0, self.screen_height) for _ in spawns])
+        else:
+            max_x = self.screen_width + 50
+            self.xs.extend([uniform(-50, max_x) for _ in spawns])
+            self.ys.extend([-50.0] * count)  # Start above screen
+        self.velocities_x.extend([uniform(vx_lo, vx_hi) for _ in spawns])
+        self.velocities_y.extend([uniform(vy_lo, vy_hi) for _ in spawns])
+        self.lives.extend([uniform(life_lo, life_hi) for _ in spawns])
+        self.sizes.extend([uniform(size_lo, size_hi) for _ in spawns])
+        self.gravities.extend([gravity] * count)
+        self.kinds.extend([_PARTICLE_KINDS[particle_type]] * count)
+        self.colors.extend([color] * count)
+        
+    def get_particle_sprite(self, cache: Dict[int, pygame.Surface], radius: int,
+                            color: Tuple[int, ...]) -> pygame.Surface:
+        """Get a cached circle sprite of the given radius, drawing it on first use"""
+        sprite = cache.get(radius)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            cache[radius] = sprite
+        return sprite
         
     def render(self, screen: pygame.Surface):
         """Render all particles"""
-        for particle in self.particles:
-            if particle.type == "fog":
+        xs = self.xs
+        if not xs:
+            return
+            
+        ys = self.ys
+        sizes = self.sizes
+        kinds = self.kinds
+        colors = self.colors
+        velocities_x = self.velocities_x
+        velocities_y = self.velocities_y
+        fog_sprites = self._fog_sprites
+        snow_sprites = self._snow_sprites
+        draw_line = pygame.draw.line
+        
+        # Sprite particles are collected and submitted to SDL in one batch
+        sprite_blits = []
+        
+        for i in range(len(xs)):
+            kind = kinds[i]
+            x = xs[i]
+            y = ys[i]
+            size = sizes[i]
+            
+            if kind == PARTICLE_RAIN:
+                # Rain as lines; each drop is its own segment
+                draw_line(screen, colors[i], 
+                          (int(x), int(y)), 
+                          (int(x + velocities_x[i] * 0.1), int(y + velocities_y[i] * 0.1)),
+                          max(1, int(size)))
+            elif kind == PARTICLE_FOG:
                 # Render fog as semi-transparent circles
-                fog_surface = pygame.Surface((int(particle.size * 2), int(particle.size * 2)), pygame.SRCALPHA)
-                pygame.draw.circle(fog_surface, (*particle.color[:3], 30), 
-                                 (int(particle.size), int(particle.size)), int(particle.size))
-                screen.blit(fog_surface, (int(particle.x - particle.size), int(particle.y - particle.size)))
+                radius = int(size)
+                sprite = fog_sprites.get(radius)
+                if sprite is None:
+                    sprite = self.get_particle_sprite(fog_sprites, radius, (*colors[i], 30))
+                sprite_blits.append((sprite, (int(x) - radius, int(y) - radius)))
             else:
-                # Render rain/snow as small circles or lines
-                if particle.type == "rain":
-                    # Rain as lines
-                    end_x = particle.x + particle.velocity_x * 0.1
-                    end_y = particle.y + particle.velocity_y * 0.1
-                    pygame.draw.line(screen, particle.color[:3], 
-                                   (int(particle.x), int(particle.y)), 
-                                   (int(end_x), int(end_y)), max(1, int(particle.size)))
-                else:
-                    # Snow as circles
-                    pygame.draw.circle(screen, particle.color[:3], 
-                                     (int(particle.x), int(particle.y)), max(1, int(particle.size)))
+                # Snow as circles
+                radius = max(1, int(size))
+                sprite = snow_sprites.get(radius)
+                if sprite is None:
+                    sprite = self.get_particle_sprite(snow_sprites, radius, colors[i])
+                sprite_blits.append((sprite, (int(x) - radius, int(y) - radius)))
+                
+        if sprite_blits:
+            if hasattr(screen, "fblits"):  # pygame 2.1.3+
+                screen.fblits(sprite_blits)
+            else:
+                screen.blits(sprite_blits, doreturn=False)
 
 class EnvironmentManager:
     """Main environment manager that coordinates all environmental systems"""
+    __slots__ = ('time_system', 'weather_system', 'particle_system', 'temperature', 'humidity',
+                 'air_pressure', 'environmental_events', 'event_check_timer', 'synced_with_game_time',
+                 '_overlay_cache')
     
     def __init__(self):
         self.time_system = TimeSystem()
@@ -469,6 +678,9 @@ class EnvironmentManager:
         # Sync with game state time
         self.synced_with_game_time = False
         
+        # Darkness overlays keyed by (screen size, darkness)
+        self._overlay_cache: Dict[Tuple[Tuple[int, int], int], pygame.Surface] = {}
+        
     def sync_with_game_state(self, game_state):
         """Sync environment time with game state time"""
         self.time_system.game_hour = game_state.game_hour
@@ -549,21 +761,20 @@ class EnvironmentManager:
             
     def trigger_environmental_event(self, event_type: str):
         """Trigger a special environmental event"""
-        event = {
-            'type': event_type,
-            'duration': random.uniform(30.0, 120.0),  # 30 seconds to 2 minutes
-            'intensity': random.uniform(0.5, 1.0),
-            'timer': 0.0
-        }
+        event = EnvironmentalEvent(
+            event_type,
+            random.uniform(30.0, 120.0),  # 30 seconds to 2 minutes
+            random.uniform(0.5, 1.0)
+        )
         self.environmental_events.append(event)
         
     def apply_environmental_effects(self, game_state, dt: float):
         """Apply environmental effects to game state"""
         # Weather effects on resources
-        solar_mod = self.weather_system.get_solar_modifier()
-        productivity_mod = self.weather_system.get_productivity_modifier()
-        happiness_mod = self.weather_system.get_happiness_modifier()
-        energy_drain = self.weather_system.get_energy_drain_rate()
+        weather = self.weather_system
+        solar_mod = weather.get_solar_modifier()
+        happiness_mod = weather.get_happiness_modifier()
+        energy_drain = weather.get_energy_drain_rate()
         
         # Apply solar effects to any solar generators
         if solar_mod != 1.0:
@@ -576,79 +787,51 @@ class EnvironmentManager:
                 game_state.resources.surge_capacitor - energy_drain * dt / 3600.0)
             
         # Apply effects to Nanos - only affect those outside buildings during bad weather
-        for nano in game_state.nanos.values():
-            # Productivity effects - only if working and not in building
-            if hasattr(nano, 'productivity_modifier'):
-                nano.productivity_modifier = productivity_mod
-                
-            # Happiness effects - reduced for those in shelter during bad weather
-            if happiness_mod != 0:
-                # Nanos inside buildings get protection from bad weather
-                weather_protection = 0.5 if nano.inside_building and happiness_mod < 0 else 1.0
-                adjusted_happiness_mod = happiness_mod * weather_protection
-                nano.happy = max(0, min(100, nano.happy + adjusted_happiness_mod * dt))
+        # Per-tick happiness steps; nanos inside buildings get protection from bad weather
+        happiness_step = happiness_mod * dt
+        sheltered_step = happiness_step * 0.5
+        nanos = game_state.nanos.values()
+        
+        # One specialised loop per sign, so each only clamps the bound it can reach
+        if happiness_step > 0:
+            for nano in nanos:
+                happy = nano.happy + happiness_step
+                nano.happy = happy if happy < 100 else 100
+        elif happiness_step < 0:
+            for nano in nanos:
+                happy = nano.happy + (sheltered_step if nano.inside_building else happiness_step)
+                nano.happy = happy if happy > 0 else 0
                 
         # Handle special events
-        for event in self.environmental_events[:]:
-            event['timer'] += dt
+        events = self.environmental_events
+        i = 0
+        while i < len(events):
+            event = events[i]
+            event.timer += dt
             
-            if event['type'] == "solar_flare":
-                # Boost energy generation
-                game_state.resources.work_power *= (1.0 + event['intensity'] * 0.5)
-            elif event['type'] == "magnetic_storm":
-                # Drain energy
-                drain = event['intensity'] * 0.5 * dt
-                game_state.resources.surge_capacitor = max(0, 
-                    game_state.resources.surge_capacitor - drain)
-            elif event['type'] == "meteor_shower":
-                # Random resource bonus
-                if random.random() < 0.1:  # 10% chance per second
-                    game_state.resources.add_eu(event['intensity'] * 0.1)
-                    
-            # Remove expired events
-            if event['timer'] >= event['duration']:
-                self.environmental_events.remove(event)
+            handler = _EVENT_HANDLERS.get(event.type)
+            if handler is not None:
+                handler(game_state, event, dt)
                 
-    def get_sky_color(self) -> Tuple[int, int, int]:
-        """Get current sky color based on time and weather"""
-        is_day = self.time_system.is_daytime()
-        weather = self.weather_system.current_weather
-        
-        if is_day:
-            if weather == WeatherType.CLEAR:
-                return (135, 206, 235)  # Sky blue
-            elif weather == WeatherType.CLOUDY:
-                return (100, 150, 200)  # Cloudy blue
-            elif weather == WeatherType.RAIN or weather == WeatherType.STORM:
-                return (70, 100, 150)   # Storm blue
-            elif weather == WeatherType.FOG:
-                return (150, 150, 150)  # Grey
-            elif weather == WeatherType.SNOW:
-                return (200, 200, 220)  # Snowy grey
-        else:
-            # Night colors
-            if weather == WeatherType.CLEAR:
-                return (25, 25, 112)    # Midnight blue
+            # Remove expired events by swapping the last one into this slot
+            # (it is processed next, as the slot is revisited)
+            if event.timer >= event.duration:
+                events[i] = events[-1]
+                events.pop()
             else:
-                return (15, 15, 60)     # Dark night
+                i += 1
                 
-        return (50, 50, 50)  # Default
+    def get_sky_color(self) -> Tuple[int, int, int]:
+        """Get current sky color based on time and weather"""
+        return _SKY_COLORS.get((self.time_system.is_daytime(), self.weather_system.current_weather), (50, 50, 50))
         
     def get_ambient_light(self) -> float:
         """Get ambient light level"""
         base_light = self.time_system.get_light_level()
         
         # Weather modifications
-        weather = self.weather_system.current_weather
-        if weather == WeatherType.STORM:
-            base_light *= 0.6
-        elif weather == WeatherType.RAIN:
-            base_light *= 0.8
-        elif weather == WeatherType.FOG:
-            base_light *= 0.7
-        elif weather == WeatherType.SNOW:
-            base_light *= 0.9
-            
+        base_light *= _LIGHT_MULT.get(self.weather_system.current_weather, 1.0)
+        
         return max(0.1, min(1.0, base_light))
         
     def render_environmental_overlay(self, screen: pygame.Surface):
@@ -656,13 +839,21 @@ class EnvironmentManager:
         # Render particles
         self.particle_system.render(screen)
         
-        # Render ambient lighting overlay
-        light_level = self.get_ambient_light()
-        if light_level < 1.0:
-            darkness = int((1.0 - light_level) * 100)
-            overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        # Render ambient lighting overlay; darkness is quantized to steps of 5
+        # so a handful of cached overlays cover every level
+        darkness = int((1.0 - self.get_ambient_light()) * 100) // 5 * 5
+        if darkness <= 0:
+            return  # Full daylight: no overlay at all
+            
+        key = (screen.get_size(), darkness)
+        overlay = self._overlay_cache.get(key)
+        if overlay is None:
+            if len(self._overlay_cache) >= 32:  # Stale sizes after resizes
+                self._overlay_cache.clear()
+            overlay = pygame.Surface(key[0], pygame.SRCALPHA)
             overlay.fill((0, 0, 0, darkness))
-            screen.blit(overlay, (0, 0))
+            self._overlay_cache[key] = overlay
+        screen.blit(overlay, (0, 0))
             
     def get_environment_info(self) -> Dict[str, str]:
         """Get formatted environment information for UI"""
@@ -8,11 +8,63 @@ and coordinates all game systems.
 import pygame
 import math
 import random
+import functools
 import logging
 from typing import List, Dict, Optional, Tuple
 from models import *
 from config import *
 
+# Event types InputHandler consumes; the main loop fetches each group with a
+# typed pygame.event.get so SDL filters the queue instead of Python
+MOUSE_BUTTON_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+KEY_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+
+_log = logging.getLogger("nanoverse.game")
+
+# Cell hit circle (approximates the hexagon) and its square, for sqrt-free tests
+_CELL_HIT_RADIUS = GRID_SIZE // 2 - 6
+_CELL_HIT_RADIUS_SQ = _CELL_HIT_RADIUS * _CELL_HIT_RADIUS
+
+# Most expired labels/effects kept around for reuse
+_POOL_LIMIT = 64
+
+# Module-level bindings for RNG calls made in per-nano AI paths
+_rand = random.random
+_uniform = random.uniform
+_randint = random.randint
+
+# 256-entry sine table for the power-effect pulse, indexed by phase * _SIN_LUT_SCALE & 255
+_SIN_LUT = [math.sin(i * 2 * math.pi / 256) for i in range(256)]
+_SIN_LUT_SCALE = 256 / (2 * math.pi)
+_PULSE_LUT_SCALE = 8 * _SIN_LUT_SCALE  # Pulse runs at 8 rad/s
+
+# Building type each nano state enters on arrival; BIO and TENT only admit the
+# nano's own work place and home
+_ENTRY_BUILDING_TYPE = {
+    NanoState.WORKING: BuildingType.BIO,
+    NanoState.SLEEPING: BuildingType.TENT,
+    NanoState.HAPPY_TIME: BuildingType.MUSIC,
+    NanoState.LEARNING: BuildingType.STUDY,
+    NanoState.TRAINING: BuildingType.CAMP,
+}
+
+# Nano schedule by game hour: work 8-16, sleep 22-6, free time otherwise
+_WORK_TIME, _SLEEP_TIME, _FREE_TIME = 0, 1, 2
+_HOUR_SCHEDULE = tuple(_WORK_TIME if 8 <= h < 16 else _SLEEP_TIME if h >= 22 or h < 6 else _FREE_TIME
+                       for h in range(24))
+
+# Scheduled stays per phase: (phase, building type, arrival state, nano attributes
+# holding the claimed building's id and object, idle-and-wander when not heading there)
+_SCHEDULED_STAYS = (
+    (_WORK_TIME, BuildingType.BIO, NanoState.WORKING, 'assigned_building', 'assigned_building_ref', False),
+    (_SLEEP_TIME, BuildingType.TENT, NanoState.SLEEPING, 'home_building', 'home_building_ref', True),
+)
+
+# Building type a nano can sit in untouched during each schedule phase (work
+# place during work, home during sleep), indexed by _HOUR_SCHEDULE value
+_SETTLED_BUILDING_TYPE = (BuildingType.BIO, BuildingType.TENT, None)
+_MEAL_HOURS = tuple(h in (8, 12, 18) for h in range(24))  # Indexed by game hour
+
 class InputHandler:
     """Handles all input processing for the game"""
     def __init__(self):
@@ -23,36 +75,55 @@ class InputHandler:
         self.right_mouse_released = False
         self.keys_pressed = set()
         self.keys_released = set()
+        self._prev_mouse_buttons = (False, False, False)
         
-    def update(self, events: List[pygame.event.Event]):
-        """Update input state based on events"""
-        self.mouse_pressed = False
-        self.mouse_released = False
-        self.right_mouse_pressed = False
-        self.right_mouse_released = False
+    def update(self, mouse_events: List[pygame.event.Event], key_events: List[pygame.event.Event]):
+        """Update input state from pre-filtered mouse button and key events"""
+        prev = self._prev_mouse_buttons
+        cur = pygame.mouse.get_pressed()
+        
+        # Idle frame (the common case): no events and no button change, so only
+        # the edge flags need resetting, and the position only if the mouse moved
+        if not mouse_events and not key_events and cur == prev:
+            self.mouse_pressed = False
+            self.mouse_released = False
+            self.right_mouse_pressed = False
+            self.right_mouse_released = False
+            if self.keys_released:
+                self.keys_released.clear()
+            if pygame.mouse.get_rel() != (0, 0):
+                self.mouse_pos = pygame.mouse.get_pos()
+            return
+            
         self.keys_released.clear()
         
-        for event in events:
+        # Button edges come from one state poll per frame...
+        self._prev_mouse_buttons = cur
+        self.mouse_pressed = cur[0] and not prev[0]
+        self.mouse_released = prev[0] and not cur[0]
+        self.right_mouse_pressed = cur[2] and not prev[2]
+        self.right_mouse_released = prev[2] and not cur[2]
+        
+        # ...plus any button events, so clicks shorter than a frame still register
+        for event in mouse_events:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     self.mouse_pressed = True
                 elif event.button == 3:  # Right click
                     self.right_mouse_pressed = True
-                    
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:  # Left click
-                    self.mouse_released = True
-                elif event.button == 3:  # Right click
-                    self.right_mouse_released = True
-                    
-            elif event.type == pygame.KEYDOWN:
-                self.keys_pressed.add(event.key)
+            elif event.button == 1:  # Left click
+                self.mouse_released = True
+            elif event.button == 3:  # Right click
+                self.right_mouse_released = True
                 
-            elif event.type == pygame.KEYUP:
-                if event.key in self.keys_pressed:
-                    self.keys_pressed.remove(event.key)
+        for event in key_events:
+            if event.type == pygame.KEYDOWN:
+                self.keys_pressed.add(event.key)
+            else:
+                self.keys_pressed.discard(event.key)
                 self.keys_released.add(event.key)
                 
+        pygame.mouse.get_rel()  # Reset the motion accumulator for the idle check
         self.mouse_pos = pygame.mouse.get_pos()
 
 class GameMode(Enum):
@@ -61,6 +132,15 @@ class GameMode(Enum):
     BUILD_BUILDING = "build_building"
     MOVE_NANO = "move_nano"
 
+# Sub-menu buttons per build category, in click priority order; None builds a cell
+_BUILD_SUBMENUS = {
+    "POWER": (("CELL", None), ("BIO", BuildingType.BIO)),
+    "HOME": (("TENT", BuildingType.TENT),),
+    "BRAIN": (("STUDY", BuildingType.STUDY),),
+    "HAPPY": (("MUSIC", BuildingType.MUSIC),),
+    "DEF": (("CAMP", BuildingType.CAMP),),
+}
+
 class Game:
     """Main game class that manages all game systems"""
     def __init__(self, screen: pygame.Surface, clock: pygame.time.Clock):
@@ -78,6 +158,29 @@ class Game:
         self.power_effects = []  # List of power effect animations
         self.debris_objects = []  # List of dead nano debris
         
+        # Free lists of expired labels/effects, reused instead of allocating per click
+        self._label_pool: List[FloatingLabel] = []
+        self._effect_pool: List[PowerEffect] = []
+        
+        # Spatial hash of nanos in 32px buckets for click hit-testing
+        self._nano_grid: Dict[Tuple[int, int], List[int]] = {}  # bucket -> nano ids
+        self._nano_buckets: Dict[int, Tuple[int, int]] = {}  # nano id -> bucket
+        
+        # Input handler per game mode
+        self._mode_dispatch = {
+            GameMode.NORMAL: self.handle_normal_mode_input,
+            GameMode.BUILD_CELL: self.handle_build_cell_input,
+            GameMode.BUILD_BUILDING: self.handle_build_building_input,
+            GameMode.MOVE_NANO: self.handle_move_nano_input,
+        }
+        
+        # Nano AI handler per game hour, following _HOUR_SCHEDULE; scheduled
+        # stays are bound to their _SCHEDULED_STAYS row once here
+        schedule_handlers = [self.handle_free_time] * 3
+        for phase, *stay in _SCHEDULED_STAYS:
+            schedule_handlers[phase] = functools.partial(self.handle_scheduled_stay, *stay)
+        self._hour_handlers = tuple(schedule_handlers[phase] for phase in _HOUR_SCHEDULE)
+        
         # Debug mode for conditional logging
         self.debug_mode = False
         
@@ -102,6 +205,7 @@ class Game:
             self.screen_width - UI_PANEL_WIDTH - INFO_PANEL_WIDTH - 30,
             self.screen_height - TIME_BAR_HEIGHT - 100
         )
+        self._recompute_layout()
         
         # Button areas (updated to match the simple UI positions)
         button_y = TIME_BAR_HEIGHT + 70
@@ -136,6 +240,12 @@ class Game:
             "CAMP": pygame.Rect(sub_x, sub_y, 100, 30),
         }
         
+        # Button columns are evenly pitched, so clicks resolve by row arithmetic
+        self._button_hit = {
+            "main": self._make_button_column(self.button_rects),
+            "build": self._make_button_column(self.build_menu_rects),
+        }
+        
         # Info panel area
         self.info_panel_rect = pygame.Rect(
             self.screen_width - INFO_PANEL_WIDTH - 10,
@@ -155,27 +265,97 @@ class Game:
             "NEXT": pygame.Rect(info_panel_x + 65, nav_y, 45, 25),
         }
         
+        # Click targets resolved once: sub-menu (rect, building type) per build
+        # category, and (rect, action) for the hire panel. The rects are shared
+        # with the dicts above, so resizes that move them carry over.
+        self._build_sub_targets = {
+            category: tuple((self.build_sub_rects[sub_name], building_type)
+                            for sub_name, building_type in subs)
+            for category, subs in _BUILD_SUBMENUS.items()
+        }
+        self._hire_actions = (
+            (self.hire_panel_rects["ACCEPT"], self._hire_selected_nano),
+            (self.hire_panel_rects["PREV"], self._show_previous_hire),
+            (self.hire_panel_rects["NEXT"], self._show_next_hire),
+        )
+        
+    @staticmethod
+    def _make_button_column(rects: Dict[str, pygame.Rect]) -> Tuple[int, int, int, int, int, List[str]]:
+        """Pack a column of same-sized, evenly spaced buttons as (left, right, top, stride, height, names)"""
+        names = sorted(rects, key=lambda name: rects[name].y)
+        first = rects[names[0]]
+        stride = rects[names[1]].y - first.y if len(names) > 1 else first.height
+        return (first.left, first.right, first.top, stride, first.height, names)
+        
+    def _lookup_button(self, column: str, mouse_x: int, mouse_y: int) -> Optional[str]:
+        """Get the name of the button under the mouse in a column, if any"""
+        left, right, top, stride, height, names = self._button_hit[column]
+        if not left <= mouse_x < right or mouse_y < top:
+            return None
+        row, offset = divmod(mouse_y - top, stride)
+        if row < len(names) and offset < height:
+            return names[row]
+        return None
+        
+    def _recompute_layout(self):
+        """Precompute click geometry that only depends on the play area size"""
+        play_area_center_x = self.play_area_rect.width // 2
+        play_area_center_y = self.play_area_rect.height // 2
+        
+        # Central hub bounds (play area coordinates)
+        half_hub = GRID_SIZE // 2
+        self._hub_bbox = (play_area_center_x - half_hub, play_area_center_y - half_hub,
+                          play_area_center_x + half_hub, play_area_center_y + half_hub)
+        
+        # Central hub grid cell
+        self._center_grid = (self.play_area_rect.width // GRID_SIZE // 2,
+                             self.play_area_rect.height // GRID_SIZE // 2)
+        
     def update(self, dt: float):
         """Update all game systems"""
         # Process input first
         self.handle_input()
         
         # Update game state
-        self.state.update_time(dt)
-        self.state.update_energy_system(dt)
+        state = self.state
+        state.update_time(dt)
+        state.update_energy_system(dt)
         
-        # Update Nanos and check for deaths
+        # Update Nanos and check for deaths in a single pass
+        nanos = state.nanos
         dead_nanos = []
-        for nano in self.state.nanos.values():
+        rehash_nano = self._rehash_nano
+        
+        # The hour is fixed for the whole pass, so resolve the per-nano AI
+        # step (schedule handler, meal hour, settled type) once
+        hour = state.game_hour
+        schedule_handler = self._hour_handlers[hour]
+        meal_hour = _MEAL_HOURS[hour]
+        settled_type = _SETTLED_BUILDING_TYPE[_HOUR_SCHEDULE[hour]]
+        check_building_interaction = self.check_nano_building_interaction
+        resources = state.resources
+        for nano in nanos.values():
             nano.update_position(dt)
             nano.update_animation(dt)
-            self.update_nano_ai(nano, dt)
+            nano.activity_timer += dt
+            # Nanos in transit neither enter nor leave, and nanos settled in the
+            # building their schedule wants have nothing to check
+            if not nano.moving:
+                building = nano.current_building_ref
+                if building is None or building.type is not settled_type:
+                    check_building_interaction(nano)
+            schedule_handler(nano)
+            if meal_hour and nano.meals_today < 3:
+                nano.consume_meal(resources)
+            rehash_nano(nano)
             
             # Check if nano died
             if nano.health <= 0:
                 dead_nanos.append(nano)
                 
         # Handle nano deaths - convert to debris
+        play_area_x = self.play_area_rect.x
+        play_area_y = self.play_area_rect.y
         for dead_nano in dead_nanos:
             # Create debris object
             debris = {
@@ -188,18 +368,17 @@ class Game:
             self.debris_objects.append(debris)
             
             # Remove from game state
-            if dead_nano.id in self.state.nanos:
-                del self.state.nanos[dead_nano.id]
+            nanos.pop(dead_nano.id, None)
+            self._unhash_nano(dead_nano.id)
                 
-            # Remove from any buildings
-            for building in self.state.buildings.values():
-                if dead_nano.id in building.workers:
-                    building.workers.remove(dead_nano.id)
+            # Remove from its building; current_building is the nano -> building
+            # index (nanos are only workers of the building they are inside)
+            dead_nano.exit_building(state.buildings)
                     
             # Show death message
             self.add_floating_label(f"{dead_nano.name} died!", 
-                                  self.play_area_rect.x + int(dead_nano.x), 
-                                  self.play_area_rect.y + int(dead_nano.y), 
+                                  play_area_x + int(dead_nano.x), 
+                                  play_area_y + int(dead_nano.y), 
                                   color=(255, 0, 0))
             
         # Update floating labels
@@ -214,36 +393,51 @@ class Game:
         # Check win/lose conditions
         self.check_game_conditions()
         
+    def _rehash_nano(self, nano: Nano):
+        """Move a nano to its current spatial hash bucket if it crossed a boundary"""
+        bucket = (int(nano.x) >> 5, int(nano.y) >> 5)
+        old_bucket = self._nano_buckets.get(nano.id)
+        if bucket != old_bucket:
+            if old_bucket is not None:
+                self._nano_grid[old_bucket].remove(nano.id)
+            self._nano_grid.setdefault(bucket, []).append(nano.id)
+            self._nano_buckets[nano.id] = bucket
+            
+    def _unhash_nano(self, nano_id: int):
+        """Drop a nano from the spatial hash"""
+        bucket = self._nano_buckets.pop(nano_id, None)
+        if bucket is not None:
+            self._nano_grid[bucket].remove(nano_id)
+            
+    def _nano_at(self, play_x: int, play_y: int) -> Optional[Nano]:
+        """Get the visible nano under a play area point, checking only nearby buckets"""
+        nanos = self.state.nanos
+        nano_grid = self._nano_grid
+        for bx in range((play_x - 8) >> 5, ((play_x + 8) >> 5) + 1):
+            for by in range((play_y - 8) >> 5, ((play_y + 8) >> 5) + 1):
+                for nano_id in nano_grid.get((bx, by), ()):
+                    nano = nanos.get(nano_id)
+                    if (nano is not None and not nano.inside_building  # Only visible nanos
+                            and abs(play_x - nano.x) < 8 and abs(play_y - nano.y) < 8):
+                        return nano
+        return None
+        
     def handle_input(self):
         """Process all input"""
         mouse_x, mouse_y = self.input_handler.mouse_pos
         
         # Handle different game modes
-        if self.mode == GameMode.NORMAL:
-            self.handle_normal_mode_input(mouse_x, mouse_y)
-        elif self.mode == GameMode.BUILD_CELL:
-            self.handle_build_cell_input(mouse_x, mouse_y)
-        elif self.mode == GameMode.BUILD_BUILDING:
-            self.handle_build_building_input(mouse_x, mouse_y)
-        elif self.mode == GameMode.MOVE_NANO:
-            self.handle_move_nano_input(mouse_x, mouse_y)
+        self._mode_dispatch[self.mode](mouse_x, mouse_y)
 
     def handle_play_area_click(self, mouse_x: int, mouse_y: int):
         """Handle clicks in the play area"""
-        play_x = mouse_x - self.play_area_rect.x
-        play_y = mouse_y - self.play_area_rect.y
+        play_area_rect = self.play_area_rect
+        grid_size = GRID_SIZE
+        play_x = mouse_x - play_area_rect.x
+        play_y = mouse_y - play_area_rect.y
         
         # Check if clicking on central hub (Easter egg work button)
-        play_area_center_x = self.play_area_rect.width // 2
-        play_area_center_y = self.play_area_rect.height // 2
-        
-        # Central hub bounds
-        hub_size = GRID_SIZE
-        hub_left = play_area_center_x - hub_size // 2
-        hub_right = play_area_center_x + hub_size // 2
-        hub_top = play_area_center_y - hub_size // 2
-        hub_bottom = play_area_center_y + hub_size // 2
-        
+        hub_left, hub_top, hub_right, hub_bottom = self._hub_bbox
         if hub_left <= play_x <= hub_right and hub_top <= play_y <= hub_bottom:
             # Easter egg - central hub acts as WORK button
             self.state.work_button_pressed()
@@ -255,49 +449,44 @@ class Game:
             return
         
         # Check if clicking on a cell (for upgrades) - hexagonal hit detection
-        grid_x = play_x // GRID_SIZE
-        grid_y = play_y // GRID_SIZE
+        grid_x = play_x // grid_size
+        grid_y = play_y // grid_size
         
         # Check if there's a cell at this position with hexagonal hit detection
-        for cell in self.state.cells.values():
-            if cell.x == grid_x and cell.y == grid_y:
-                # Calculate center of the hexagonal cell
-                center_x = (cell.x * GRID_SIZE) + GRID_SIZE // 2
-                center_y = (cell.y * GRID_SIZE) + GRID_SIZE // 2
-                
-                # Check if click is within hexagonal cell bounds (approximate with circle)
-                cell_radius = GRID_SIZE // 2 - 6
-                distance = ((play_x - center_x) ** 2 + (play_y - center_y) ** 2) ** 0.5
-                
-                if distance <= cell_radius:
-                    # Specifically check if clicking on the level button area (moved lower)
-                    button_width = 32
-                    button_height = 16
-                    button_x = center_x - button_width // 2
-                    button_y = center_y + cell_radius - button_height - 4  # Updated position
-                    button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-                    
-                    # Convert play coordinates to button check
-                    if button_rect.collidepoint(play_x, play_y):
-                        # Clicked on level button - try to upgrade
-                        if self.state.upgrade_cell(cell.cell_number):
-                            self.add_floating_label(f"Cell #{cell.cell_number} → L{cell.level}!", 
-                                                  mouse_x, mouse_y)
-                        else:
-                            cost_eu, cost_credits = cell.get_upgrade_cost()
-                            self.add_floating_label(f"Need: {cost_eu:.0f} EU + {cost_credits:.0f} C", 
-                                                  mouse_x, mouse_y, color=(255, 0, 0))
-                    return
-        
-        # Check if clicking on a Nano (existing code)
-        clicked_nano = None
-        for nano in self.state.nanos.values():
-            if not nano.inside_building:  # Only select visible nanos
-                nano_rect = pygame.Rect(nano.x - 8, nano.y - 8, 16, 16)
-                if nano_rect.collidepoint(play_x, play_y):
-                    clicked_nano = nano
-                    break
-                    
+        cell = self.state.cell_at(grid_x, grid_y)
+        if cell is not None:
+            # Calculate center of the hexagonal cell
+            half_grid = grid_size // 2
+            center_x = (cell.x * grid_size) + half_grid
+            center_y = (cell.y * grid_size) + half_grid
+            
+            # Check if click is within hexagonal cell bounds (approximate with circle)
+            cell_radius = _CELL_HIT_RADIUS
+            dx = play_x - center_x
+            dy = play_y - center_y
+            
+            if dx * dx + dy * dy <= _CELL_HIT_RADIUS_SQ:
+                # Specifically check if clicking on the level button area (moved lower)
+                button_width = 32
+                button_height = 16
+                button_x = center_x - button_width // 2
+                button_y = center_y + cell_radius - button_height - 4  # Updated position
+                
+                # Convert play coordinates to button check (same bounds as Rect.collidepoint)
+                if (button_x <= play_x < button_x + button_width
+                        and button_y <= play_y < button_y + button_height):
+                    # Clicked on level button - try to upgrade
+                    if self.state.upgrade_cell(cell.cell_number):
+                        self.add_floating_label(f"Cell #{cell.cell_number} → L{cell.level}!", 
+                                              mouse_x, mouse_y)
+                    else:
+                        cost_eu, cost_credits = cell.get_upgrade_cost()
+                        self.add_floating_label(f"Need: {cost_eu:.0f} EU + {cost_credits:.0f} C", 
+                                              mouse_x, mouse_y, color=(255, 0, 0))
+                return
+        
+        # Check if clicking on a Nano
+        clicked_nano = self._nano_at(play_x, play_y)
         if clicked_nano:
             # Select nano and enter move mode
             self.dragging_nano = clicked_nano
@@ -317,14 +506,11 @@ class Game:
         # Get grid coordinates for better detection
         grid_x = play_x // GRID_SIZE
         grid_y = play_y // GRID_SIZE
-        grid_cols = self.play_area_rect.width // GRID_SIZE
-        grid_rows = self.play_area_rect.height // GRID_SIZE
-        center_grid_x = grid_cols // 2
-        center_grid_y = grid_rows // 2
+        center_grid_x, center_grid_y = self._center_grid
         
         # Only log in debug mode for performance
-        if self.debug_mode:
-            logging.debug(f"Right-click: play({play_x}, {play_y}), grid({grid_x}, {grid_y}), center({center_grid_x}, {center_grid_y})")
+        if __debug__ and self.debug_mode:
+            _log.debug(f"Right-click: play({play_x}, {play_y}), grid({grid_x}, {grid_y}), center({center_grid_x}, {center_grid_y})")
         
         # Check if right-clicking on central hub (Easter egg) - use grid coordinates with tolerance
         hub_distance = abs(grid_x - center_grid_x) + abs(grid_y - center_grid_y)
@@ -335,155 +521,127 @@ class Game:
             self.add_floating_label("EASTER EGG! +1000 Credits!", 
                                   mouse_x, mouse_y, color=(255, 215, 0))  # Gold color
             # Only log Easter egg in debug mode
-            if self.debug_mode:
-                logging.info("🎉 EASTER EGG TRIGGERED! 🎉")
+            if __debug__ and self.debug_mode:
+                _log.info("🎉 EASTER EGG TRIGGERED! 🎉")
             return
         
         # Check if right-clicking on a building
         grid_x = play_x // GRID_SIZE
         grid_y = play_y // GRID_SIZE
         
-        for building in self.state.buildings.values():
-            if building.x == grid_x and building.y == grid_y:
-                # Select building for info panel
-                self.info_panel_building = building
-                self.info_panel_nano = None  # Clear nano selection
-                self.show_hire_menu = False
-                return
+        building = self.state.building_at(grid_x, grid_y)
+        if building is not None:
+            # Select building for info panel
+            self.info_panel_building = building
+            self.info_panel_nano = None  # Clear nano selection
+            self.show_hire_menu = False
+            return
         
         # Check if right-clicking on a Nano
-        for nano in self.state.nanos.values():
-            if not nano.inside_building:  # Only check visible nanos
-                nano_rect = pygame.Rect(nano.x - 8, nano.y - 8, 16, 16)
-                if nano_rect.collidepoint(play_x, play_y):
-                    self.info_panel_nano = nano
-                    self.info_panel_building = None  # Clear building selection
-                    self.show_hire_menu = False
-                    break
+        nano = self._nano_at(play_x, play_y)
+        if nano:
+            self.info_panel_nano = nano
+            self.info_panel_building = None  # Clear building selection
+            self.show_hire_menu = False
                     
     def handle_normal_mode_input(self, mouse_x: int, mouse_y: int):
         """Handle input in normal mode"""
         if self.input_handler.mouse_pressed:
             # Check UI buttons
-            if self.button_rects["WORK"].collidepoint(mouse_x, mouse_y):
-                self.state.work_button_pressed()
-                self.add_floating_label(f"+{self.state.resources.work_power:.1f} EU", 
-                                      self.button_rects["WORK"].centerx, 
-                                      self.button_rects["WORK"].centery)
+            button = self._lookup_button("main", mouse_x, mouse_y)
+            state = self.state
+            resources = state.resources
+            if button == "WORK":
+                work_x, work_y = self.button_rects["WORK"].center
+                state.work_button_pressed()
+                work_power = resources.work_power
+                self.add_floating_label(f"+{work_power:.1f} EU", work_x, work_y)
                 
                 # Create power effect animation with energy.png
-                self.create_power_effect(self.button_rects["WORK"].centerx,
-                                       self.button_rects["WORK"].centery,
-                                       self.state.resources.work_power)
+                self.create_power_effect(work_x, work_y, work_power)
+                
+            elif button == "UPGD":
+                upgd_x, upgd_y = self.button_rects["UPGD"].center
                 
-            elif self.button_rects["UPGD"].collidepoint(mouse_x, mouse_y):
                 # Fixed upgrade cost calculation 
-                current_power = self.state.resources.work_power
-                if self.debug_mode:
-                    logging.debug(f"UPGD DEBUG: Current work power: {current_power:.2f}")
+                debug = __debug__ and self.debug_mode  # Checked once for the whole branch
+                current_power = resources.work_power
+                if debug:
+                    _log.debug(f"UPGD DEBUG: Current work power: {current_power:.2f}")
                 
                 # For upgrades: EU cost = 1, Credits cost = 100 (simple flat rate)
                 eu_cost = 1.0
                 credits_cost = 100.0
                 
                 # Check if player can afford upgrade - check BOTH surge capacitor AND cells
-                surge_eu = self.state.resources.surge_capacitor
-                cell_eu = self.state.get_total_cell_energy()
-                total_eu = surge_eu + cell_eu
-                
-                if self.debug_mode:
-                    logging.debug(f"UPGD DEBUG: Need {eu_cost} EU + {credits_cost} C, Have {total_eu:.2f} EU + {self.state.resources.credits:.0f} C")
+                surge_eu = resources.surge_capacitor
+                credits = resources.credits
+                total_eu = surge_eu + state.get_total_cell_energy()
                 
-                can_afford_eu = total_eu >= eu_cost
-                can_afford_credits = self.state.resources.credits >= credits_cost
+                if debug:
+                    _log.debug(f"UPGD DEBUG: Need {eu_cost} EU + {credits_cost} C, Have {total_eu:.2f} EU + {credits:.0f} C")
                 
-                if can_afford_eu and can_afford_credits:
+                if total_eu >= eu_cost and credits >= credits_cost:
                     # Deduct EU costs - try surge capacitor first, then cells
-                    eu_remaining = eu_cost
-                    if surge_eu >= eu_remaining:
-                        self.state.resources.surge_capacitor -= eu_remaining
-                        eu_remaining = 0
+                    if surge_eu >= eu_cost:
+                        resources.surge_capacitor = surge_eu - eu_cost
                     else:
-                        # Take what we can from surge capacitor
-                        self.state.resources.surge_capacitor = 0
-                        eu_remaining -= surge_eu
-                        # Take the rest from cells
-                        if eu_remaining > 0:
-                            self.state.drain_cell_energy(eu_remaining)
-                    
-                    # Deduct credits
-                    self.state.resources.credits -= credits_cost
+                        # Take what we can from surge capacitor, the rest from cells
+                        resources.surge_capacitor = 0
+                        state.drain_cell_energy(eu_cost - surge_eu)
                     
-                    # Increase work power
-                    old_power = self.state.resources.work_power
-                    self.state.resources.work_power += 0.1
-                    new_power = self.state.resources.work_power
-                    if self.debug_mode:
-                        logging.debug(f"UPGD DEBUG: Work power increased from {old_power:.2f} to {new_power:.2f}")
+                    # Deduct credits and increase work power
+                    resources.credits = credits - credits_cost
+                    new_power = current_power + 0.1
+                    resources.work_power = new_power
+                    if debug:
+                        _log.debug(f"UPGD DEBUG: Work power increased from {current_power:.2f} to {new_power:.2f}")
                     
-                    self.add_floating_label(f"Work Power: {new_power:.1f}", 
-                                          self.button_rects["UPGD"].centerx, 
-                                          self.button_rects["UPGD"].centery)
+                    self.add_floating_label(f"Work Power: {new_power:.1f}", upgd_x, upgd_y)
                 else:
                     missing = []
-                    if not can_afford_eu:
+                    if total_eu < eu_cost:
                         missing.append(f"{eu_cost:.0f} EU")
-                    if not can_afford_credits:
+                    if credits < credits_cost:
                         missing.append(f"{credits_cost:.0f} C")
                     
-                    self.add_floating_label(f"Need: {', '.join(missing)}", 
-                                          self.button_rects["UPGD"].centerx, 
-                                          self.button_rects["UPGD"].centery, 
+                    self.add_floating_label(f"Need: {', '.join(missing)}", upgd_x, upgd_y, 
                                           color=(255, 0, 0))
                     
-            elif self.button_rects["SELL"].collidepoint(mouse_x, mouse_y):
+            elif button == "SELL":
+                sell_x, sell_y = self.button_rects["SELL"].center
+                
                 # Simplified sell logic - always try cells first, then surge capacitor
-                surge_eu = self.state.resources.surge_capacitor
-                cell_eu = self.state.get_total_cell_energy()
-                total_eu = surge_eu + cell_eu
+                surge_eu = resources.surge_capacitor
+                cell_eu = state.get_total_cell_energy()
                 
-                if total_eu >= 1.0:
+                if surge_eu + cell_eu < 1.0:
+                    self.add_floating_label("Not enough EU!", sell_x, sell_y, color=(255, 0, 0))
+                else:
                     # Store current sell rate before it changes
-                    current_sell_rate = self.state.resources.sell_rate
+                    current_sell_rate = resources.sell_rate
                     
-                    # Try to sell from cells first
+                    # Try to sell from cells first, then fall back to surge capacitor
                     if cell_eu >= 1.0:
-                        if self.state.sell_cell_energy(1.0):
-                            self.add_floating_label(f"+{current_sell_rate:.0f} C", 
-                                                  self.button_rects["SELL"].centerx, 
-                                                  self.button_rects["SELL"].centery)
-                        else:
-                            self.add_floating_label("Cell sale failed!", 
-                                                  self.button_rects["SELL"].centerx, 
-                                                  self.button_rects["SELL"].centery, 
-                                                  color=(255, 0, 0))
-                    # Fall back to surge capacitor
+                        sold = state.sell_cell_energy(1.0)
+                        failure = "Cell sale failed!"
                     elif surge_eu >= 1.0:
-                        if self.state.resources.sell_eu(1.0):
-                            self.add_floating_label(f"+{current_sell_rate:.0f} C", 
-                                                  self.button_rects["SELL"].centerx, 
-                                                  self.button_rects["SELL"].centery)
-                        else:
-                            self.add_floating_label("Surge sale failed!", 
-                                                  self.button_rects["SELL"].centerx, 
-                                                  self.button_rects["SELL"].centery, 
-                                                  color=(255, 0, 0))
+                        sold = resources.sell_eu(1.0)
+                        failure = "Surge sale failed!"
                     else:
-                        self.add_floating_label("Sell error!", 
-                                              self.button_rects["SELL"].centerx, 
-                                              self.button_rects["SELL"].centery, 
-                                              color=(255, 0, 0))
-                else:
-                    self.add_floating_label("Not enough EU!", 
-                                          self.button_rects["SELL"].centerx, 
-                                          self.button_rects["SELL"].centery, 
-                                          color=(255, 0, 0))
+                        sold = False
+                        failure = "Sell error!"
+                        
+                    if sold:
+                        self.add_floating_label(f"+{current_sell_rate:.0f} C", sell_x, sell_y)
+                    else:
+                        self.add_floating_label(failure, sell_x, sell_y, color=(255, 0, 0))
                     
-            elif self.button_rects["BUILD"].collidepoint(mouse_x, mouse_y):
+            elif button == "BUILD":
                 self.show_build_menu = not self.show_build_menu
                 self.show_hire_menu = False
                 
-            elif self.button_rects["HIRE"].collidepoint(mouse_x, mouse_y):
+            elif button == "HIRE":
                 self.show_hire_menu = not self.show_hire_menu
                 self.show_build_menu = False
                 
@@ -509,191 +667,192 @@ class Game:
 
     def add_floating_label(self, text: str, x: int, y: int, color: Tuple[int, int, int] = (255, 255, 255)):
         """Add a floating text label"""
-        label = {
-            'text': text,
-            'x': float(x),
-            'y': float(y),
-            'color': color,
-            'timer': 3.0,  # Display for 3 seconds
-            'vel_y': -20   # Float upward slower
-        }
+        if self._label_pool:
+            label = self._label_pool.pop()
+            label.reset(text, x, y, color)
+        else:
+            label = FloatingLabel(text, x, y, color)
         self.floating_labels.append(label)
         # REMOVED: Print statements for performance
         return label
         
     def update_floating_labels(self, dt: float):
         """Update floating text labels"""
-        # REMOVED: Print statements for performance
-        for label in self.floating_labels[:]:
-            label['timer'] -= dt
-            label['y'] += label['vel_y'] * dt
-            label['vel_y'] += 10 * dt  # Reduced gravity for better visibility
+        # Walk backwards so expired labels can be swapped with the (already updated) last one
+        labels = self.floating_labels
+        label_pool = self._label_pool
+        gravity_step = 10 * dt  # Reduced gravity for better visibility
+        for i in range(len(labels) - 1, -1, -1):
+            label = labels[i]
+            label.timer -= dt
+            label.y += label.vel_y * dt
+            label.vel_y += gravity_step
             
-            if label['timer'] <= 0:
-                self.floating_labels.remove(label)
+            if label.timer <= 0:
+                labels[i] = labels[-1]
+                labels.pop()
+                if len(label_pool) < _POOL_LIMIT:
+                    label_pool.append(label)
                 
     def update_debris(self, dt: float):
         """Update debris objects"""
-        for debris in self.debris_objects[:]:
+        debris_objects = self.debris_objects
+        for i in range(len(debris_objects) - 1, -1, -1):
+            debris = debris_objects[i]
             debris['death_time'] += dt
             
             # Remove debris after 30 seconds
             if debris['death_time'] > 30.0:
-                self.debris_objects.remove(debris)
+                debris_objects[i] = debris_objects[-1]
+                debris_objects.pop()
                 
     def create_power_effect(self, start_x: int, start_y: int, energy_amount: float):
         """Create a power effect animation with energy.png sprite"""
         # Find a random cell to target
-        if len(self.state.cells) == 0:
+        cell_list = self.state.cell_list
+        if not cell_list:
             return
             
-        target_cell = random.choice(list(self.state.cells.values()))
+        target_cell = cell_list[int(_rand() * len(cell_list))]
         
         # Calculate target position
-        target_x = self.play_area_rect.x + target_cell.x * GRID_SIZE + GRID_SIZE // 2
-        target_y = self.play_area_rect.y + target_cell.y * GRID_SIZE + GRID_SIZE // 2
+        play_area_rect = self.play_area_rect
+        half_grid = GRID_SIZE // 2
+        target_x = play_area_rect.x + target_cell.x * GRID_SIZE + half_grid
+        target_y = play_area_rect.y + target_cell.y * GRID_SIZE + half_grid
         
         # Create power effect with energy amount
-        power_effect = {
-            'x': float(start_x),
-            'y': float(start_y),
-            'target_x': float(target_x),
-            'target_y': float(target_y),
-            'target_cell': target_cell.cell_number,
-            'energy_amount': energy_amount,
-            'phase': 'hovering',  # hovering, moving, completed
-            'timer': 0.0,
-            'hover_duration': 0.5,  # Hover for 0.5 seconds
-            'scale': 1.0,  # For pulsing effect
-            'completed': False
-        }
+        if self._effect_pool:
+            power_effect = self._effect_pool.pop()
+            power_effect.reset(start_x, start_y, target_x, target_y,
+                               target_cell.cell_number, energy_amount)
+        else:
+            power_effect = PowerEffect(start_x, start_y, target_x, target_y,
+                                       target_cell.cell_number, energy_amount)
         
         self.power_effects.append(power_effect)
         
     def update_power_effects(self, dt: float):
         """Update power effect animations"""
-        for effect in self.power_effects[:]:
-            effect['timer'] += dt
+        effects = self.power_effects
+        move_speed = 300.0  # pixels per second (faster than nano speed)
+        move_step = move_speed * dt
+        pulse_scale = _PULSE_LUT_SCALE
+        sin_lut = _SIN_LUT
+        arrivals = []
+        
+        # Advance every effect first; the (rare) arrivals are settled afterwards
+        for effect in effects:
+            effect.timer += dt
             
-            if effect['phase'] == 'hovering':
+            phase = effect.phase
+            if phase == EFFECT_HOVERING:
                 # Hover and pulse for 0.5 seconds
-                effect['scale'] = 1.0 + 0.3 * math.sin(effect['timer'] * 8)  # Pulsing effect
+                effect.scale = 1.0 + 0.3 * sin_lut[int(effect.timer * pulse_scale) & 255]  # Pulsing effect
                 
-                if effect['timer'] >= effect['hover_duration']:
-                    effect['phase'] = 'moving'
-                    effect['timer'] = 0.0
-                    effect['scale'] = 1.0
+                if effect.timer >= effect.hover_duration:
+                    effect.phase = EFFECT_MOVING
+                    effect.timer = 0.0
+                    effect.scale = 1.0
                     
-            elif effect['phase'] == 'moving':
+            elif phase == EFFECT_MOVING:
                 # Move towards target cell
-                move_speed = 300.0  # pixels per second (faster than nano speed)
+                dx = effect.target_x - effect.x
+                dy = effect.target_y - effect.y
+                distance_sq = dx * dx + dy * dy
                 
-                dx = effect['target_x'] - effect['x']
-                dy = effect['target_y'] - effect['y']
-                distance = (dx ** 2 + dy ** 2) ** 0.5
-                
-                if distance < 5:  # Close enough
-                    effect['phase'] = 'completed'
-                    
-                    # Add energy to the target cell immediately
-                    if effect['target_cell'] in self.state.cells:
-                        cell = self.state.cells[effect['target_cell']]
-                        cell_capacity = float(cell.level)
-                        current_storage = getattr(cell, 'stored_energy', 0.0)
-                        
-                        # Fill the cell with the energy amount
-                        energy_to_add = min(effect['energy_amount'], cell_capacity - current_storage)
-                        if energy_to_add > 0:
-                            cell.stored_energy = current_storage + energy_to_add
-                            
-                    # Mark for removal
-                    effect['completed'] = True
+                if distance_sq < 25:  # Close enough (within 5px)
+                    arrivals.append(effect)
                 else:
-                    # Move towards target
-                    move_x = (dx / distance) * move_speed * dt
-                    move_y = (dy / distance) * move_speed * dt
-                    effect['x'] += move_x
-                    effect['y'] += move_y
+                    # Move towards target: one scale factor covers normalize and step
+                    inv = move_step / math.sqrt(distance_sq)
+                    effect.x += dx * inv
+                    effect.y += dy * inv
                     
-            # Remove completed effects
-            if effect.get('completed', False):
-                self.power_effects.remove(effect)
+        if not arrivals:
+            return
+            
+        self._apply_power_arrivals(arrivals)
+        
+        # Remove completed effects, keeping them for reuse
+        effect_pool = self._effect_pool
+        for i in range(len(effects) - 1, -1, -1):
+            effect = effects[i]
+            if effect.phase == EFFECT_COMPLETED:
+                effects[i] = effects[-1]
+                effects.pop()
+                if len(effect_pool) < _POOL_LIMIT:
+                    effect_pool.append(effect)
+                
+    def _apply_power_arrivals(self, arrivals: List[PowerEffect]):
+        """Deliver the energy of power effects that reached their target cell"""
+        cells = self.state.cells
+        for effect in arrivals:
+            effect.phase = EFFECT_COMPLETED  # Marks it for removal
+            
+            # Add energy to the target cell immediately
+            if effect.target_cell in cells:
+                cell = cells[effect.target_cell]
+                cell_capacity = float(cell.level)
+                current_storage = getattr(cell, 'stored_energy', 0.0)
+                
+                # Fill the cell with the energy amount
+                energy_to_add = min(effect.energy_amount, cell_capacity - current_storage)
+                if energy_to_add > 0:
+                    cell.stored_energy = current_storage + energy_to_add
     
     def handle_build_menu_input(self, mouse_x: int, mouse_y: int):
         """Handle build menu input"""
-        if self.build_menu_rects["POWER"].collidepoint(mouse_x, mouse_y):
-            self.build_category = "POWER"
-            
-        elif self.build_menu_rects["HOME"].collidepoint(mouse_x, mouse_y):
-            self.build_category = "HOME"
-            
-        elif self.build_menu_rects["BRAIN"].collidepoint(mouse_x, mouse_y):
-            self.build_category = "BRAIN"
+        category = self._lookup_button("build", mouse_x, mouse_y)
+        if category is not None:
+            self.build_category = category
             
-        elif self.build_menu_rects["HAPPY"].collidepoint(mouse_x, mouse_y):
-            self.build_category = "HAPPY"
-            
-        elif self.build_menu_rects["DEF"].collidepoint(mouse_x, mouse_y):
-            self.build_category = "DEF"
-            
-        # Handle sub-menu clicks
-        elif self.build_category == "POWER":
-            if self.build_sub_rects["CELL"].collidepoint(mouse_x, mouse_y):
-                next_cell_number = len(self.state.cells) + 1
-                if next_cell_number <= 100:  # Only allow if not at max
-                    self.mode = GameMode.BUILD_CELL
-                    self.show_build_menu = False
-            elif self.build_sub_rects["BIO"].collidepoint(mouse_x, mouse_y):
-                self.mode = GameMode.BUILD_BUILDING
-                self.selected_building_type = BuildingType.BIO
-                self.show_build_menu = False
-                
-        elif self.build_category == "HOME":
-            if self.build_sub_rects["TENT"].collidepoint(mouse_x, mouse_y):
-                self.mode = GameMode.BUILD_BUILDING
-                self.selected_building_type = BuildingType.TENT
-                self.show_build_menu = False
-                
-        elif self.build_category == "BRAIN":
-            if self.build_sub_rects["STUDY"].collidepoint(mouse_x, mouse_y):
-                self.mode = GameMode.BUILD_BUILDING
-                self.selected_building_type = BuildingType.STUDY
-                self.show_build_menu = False
-                
-        elif self.build_category == "HAPPY":
-            if self.build_sub_rects["MUSIC"].collidepoint(mouse_x, mouse_y):
-                self.mode = GameMode.BUILD_BUILDING
-                self.selected_building_type = BuildingType.MUSIC
-                self.show_build_menu = False
-                
-        elif self.build_category == "DEF":
-            if self.build_sub_rects["CAMP"].collidepoint(mouse_x, mouse_y):
-                self.mode = GameMode.BUILD_BUILDING
-                self.selected_building_type = BuildingType.CAMP
-                self.show_build_menu = False
+        # Handle sub-menu clicks for the open category
+        else:
+            for rect, building_type in self._build_sub_targets.get(self.build_category, ()):
+                if rect.collidepoint(mouse_x, mouse_y):
+                    if building_type is None:  # CELL
+                        next_cell_number = len(self.state.cells) + 1
+                        if next_cell_number <= 100:  # Only allow if not at max
+                            self.mode = GameMode.BUILD_CELL
+                            self.show_build_menu = False
+                    else:
+                        self.mode = GameMode.BUILD_BUILDING
+                        self.selected_building_type = building_type
+                        self.show_build_menu = False
+                    break
 
     def handle_hire_menu_input(self, mouse_x: int, mouse_y: int):
         """Handle hire menu input"""
-        if self.hire_panel_rects["ACCEPT"].collidepoint(mouse_x, mouse_y):
-            if self.state.current_hire_index < len(self.state.hired_nanos):
-                nano = self.state.hired_nanos[self.state.current_hire_index]
-                if self.state.hire_nano(nano):
-                    self.add_floating_label(f"Hired {nano.name}!", 
-                                          self.hire_panel_rects["ACCEPT"].centerx, 
-                                          self.hire_panel_rects["ACCEPT"].centery)
-                else:
-                    self.add_floating_label("Not enough Credits!", 
-                                          self.hire_panel_rects["ACCEPT"].centerx, 
-                                          self.hire_panel_rects["ACCEPT"].centery, 
-                                          color=(255, 0, 0))
-                    
-        elif self.hire_panel_rects["PREV"].collidepoint(mouse_x, mouse_y):
-            if self.state.current_hire_index > 0:
-                self.state.current_hire_index -= 1
+        for rect, action in self._hire_actions:
+            if rect.collidepoint(mouse_x, mouse_y):
+                action()
+                break
                 
-        elif self.hire_panel_rects["NEXT"].collidepoint(mouse_x, mouse_y):
-            if self.state.current_hire_index < len(self.state.hired_nanos) - 1:
-                self.state.current_hire_index += 1
+    def _hire_selected_nano(self):
+        """Hire the nano shown in the hire panel"""
+        if self.state.current_hire_index < len(self.state.hired_nanos):
+            accept_rect = self.hire_panel_rects["ACCEPT"]
+            nano = self.state.hired_nanos[self.state.current_hire_index]
+            if self.state.hire_nano(nano):
+                self.add_floating_label(f"Hired {nano.name}!", 
+                                      accept_rect.centerx, 
+                                      accept_rect.centery)
+            else:
+                self.add_floating_label("Not enough Credits!", 
+                                      accept_rect.centerx, 
+                                      accept_rect.centery, 
+                                      color=(255, 0, 0))
+                
+    def _show_previous_hire(self):
+        """Step the hire panel back one candidate"""
+        if self.state.current_hire_index > 0:
+            self.state.current_hire_index -= 1
+            
+    def _show_next_hire(self):
+        """Step the hire panel forward one candidate"""
+        if self.state.current_hire_index < len(self.state.hired_nanos) - 1:
+            self.state.current_hire_index += 1
 
     def handle_build_cell_input(self, mouse_x: int, mouse_y: int):
         """Handle cell building input"""
@@ -748,74 +907,35 @@ class Game:
         # This is now handled by handle_play_area_right_click
         pass
 
-    def update_nano_ai(self, nano: Nano, dt: float):
-        """Update Nano AI behavior - enhanced for building seeking"""
-        current_hour = self.state.game_hour
-        
-        # Update activity timer
-        nano.activity_timer += dt
-        
-        # Handle building entry/exit based on position
-        self.check_nano_building_interaction(nano)
-        
-        # Determine nano's desired activity based on time and needs
-        if 8 <= current_hour < 16:  # Work hours (8 AM to 4 PM)
-            self.handle_work_time(nano)
-        elif 22 <= current_hour or current_hour < 6:  # Sleep hours (10 PM to 6 AM)
-            self.handle_sleep_time(nano)
-        else:  # Free time (6 AM to 8 AM, 4 PM to 10 PM)
-            self.handle_free_time(nano)
-            
-        # Handle meal times
-        if current_hour in [8, 12, 18] and nano.meals_today < 3:
-            nano.consume_meal(self.state.resources)
-            
-    def handle_work_time(self, nano: Nano):
-        """Handle nano behavior during work hours"""
-        # Try to assign to work building if not assigned
-        if nano.assigned_building is None:
-            work_building_id = self.state.find_available_building(BuildingType.BIO)
-            if work_building_id:
-                nano.assigned_building = work_building_id
-                
-        # Move to work building
-        if nano.assigned_building and not nano.inside_building:
-            if nano.assigned_building in self.state.buildings:
-                building = self.state.buildings[nano.assigned_building]
-                target_x = building.x * GRID_SIZE + GRID_SIZE // 2
-                target_y = building.y * GRID_SIZE + GRID_SIZE // 2
-                
-                if not nano.moving:
-                    nano.move_to(target_x, target_y)
-                    nano.state = NanoState.WORKING
-                    
-    def handle_sleep_time(self, nano: Nano):
-        """Handle nano behavior during sleep hours"""
-        # Assign home if needed
-        self.state.assign_nano_home(nano)
-        
-        # Move to home if has one
-        if nano.home_building and not nano.inside_building:
-            if nano.home_building in self.state.buildings:
-                building = self.state.buildings[nano.home_building]
-                target_x = building.x * GRID_SIZE + GRID_SIZE // 2
-                target_y = building.y * GRID_SIZE + GRID_SIZE // 2
-                
-                if not nano.moving:
-                    nano.move_to(target_x, target_y)
-                    nano.state = NanoState.SLEEPING
-        else:
-            # No home available, wander around
+    def handle_scheduled_stay(self, building_type: BuildingType, arrival_state: NanoState,
+                              id_attr: str, ref_attr: str, wander_otherwise: bool, nano: Nano):
+        """Handle nano behavior during work or sleep hours (see _SCHEDULED_STAYS)"""
+        # Claim a building of the type if the nano has none yet
+        building = getattr(nano, ref_attr)
+        if building is None:
+            building_id = self.state.find_available_building(building_type)
+            if building_id:
+                building = self.state.buildings[building_id]
+                setattr(nano, id_attr, building_id)
+                setattr(nano, ref_attr, building)
+                
+        # Move to the building
+        if building is not None and not nano.inside_building:
+            if not nano.moving:
+                nano.move_to(building.center_x, building.center_y)
+                nano.state = arrival_state
+        elif wander_otherwise:
+            # Nowhere to head for, wander around
             nano.state = NanoState.IDLE
-            if not nano.moving and random.random() < 0.01:
+            if not nano.moving and _rand() < 0.01:
                 self.make_nano_wander(nano)
                 
     def handle_free_time(self, nano: Nano):
         """Handle nano behavior during free time"""
         # Exit work building if inside one
-        if nano.inside_building and nano.current_building:
-            building = self.state.buildings.get(nano.current_building)
-            if building and building.type == BuildingType.BIO:
+        if nano.inside_building:
+            building = nano.current_building_ref
+            if building is not None and building.type == BuildingType.BIO:
                 nano.exit_building(self.state.buildings)
                 return
                 
@@ -825,28 +945,36 @@ class Game:
             
     def choose_free_time_activity(self, nano: Nano):
         """Choose what nano should do in free time"""
-        activities = []
+        find_available_building = self.state.find_available_building
+        chosen_type = None
+        chosen_building = None
+        count = 0
         
-        # Add activities based on needs and building availability
+        # Pick uniformly among the needed activities with a free building,
+        # reservoir style (the k-th candidate replaces the pick with chance 1/k)
         if nano.happy < 80:  # Need happiness
-            music_building = self.state.find_available_building(BuildingType.MUSIC)
+            music_building = find_available_building(BuildingType.MUSIC)
             if music_building:
-                activities.append(('MUSIC', music_building))
+                count += 1
+                chosen_type, chosen_building = 'MUSIC', music_building
                 
         if nano.skills[SkillType.WORKER] < 5:  # Need learning
-            study_building = self.state.find_available_building(BuildingType.STUDY)
+            study_building = find_available_building(BuildingType.STUDY)
             if study_building:
-                activities.append(('STUDY', study_building))
-                
+                count += 1
+                if _rand() * count < 1:
+                    chosen_type, chosen_building = 'STUDY', study_building
+                    
         if nano.force < 15:  # Need training
-            camp_building = self.state.find_available_building(BuildingType.CAMP)
+            camp_building = find_available_building(BuildingType.CAMP)
             if camp_building:
-                activities.append(('CAMP', camp_building))
-                
-        # Choose random activity or wander
-        if activities and random.random() < 0.7:  # 70% chance to use building
-            activity_type, building_id = random.choice(activities)
-            self.send_nano_to_building(nano, building_id, activity_type)
+                count += 1
+                if _rand() * count < 1:
+                    chosen_type, chosen_building = 'CAMP', camp_building
+                    
+        # Choose the picked activity or wander
+        if count and _rand() < 0.7:  # 70% chance to use building
+            self.send_nano_to_building(nano, chosen_building, chosen_type)
         else:
             # Wander around
             nano.state = NanoState.IDLE
@@ -857,8 +985,8 @@ class Game:
         """Send nano to a specific building for an activity"""
         if building_id in self.state.buildings:
             building = self.state.buildings[building_id]
-            target_x = building.x * GRID_SIZE + GRID_SIZE // 2
-            target_y = building.y * GRID_SIZE + GRID_SIZE // 2
+            target_x = building.center_x
+            target_y = building.center_y
             
             if not nano.moving:
                 nano.move_to(target_x, target_y)
@@ -866,24 +994,21 @@ class Game:
                 # Set state based on activity
                 if activity_type == 'MUSIC':
                     nano.state = NanoState.HAPPY_TIME
-                    nano.activity_duration = random.uniform(30, 120)  # 30 seconds to 2 minutes
+                    nano.activity_duration = _uniform(30, 120)  # 30 seconds to 2 minutes
                 elif activity_type == 'STUDY':
                     nano.state = NanoState.LEARNING
-                    nano.activity_duration = random.uniform(60, 180)  # 1 to 3 minutes
+                    nano.activity_duration = _uniform(60, 180)  # 1 to 3 minutes
                 elif activity_type == 'CAMP':
                     nano.state = NanoState.TRAINING
-                    nano.activity_duration = random.uniform(45, 150)  # 45 seconds to 2.5 minutes
+                    nano.activity_duration = _uniform(45, 150)  # 45 seconds to 2.5 minutes
                     
                 nano.activity_timer = 0.0
                 
     def make_nano_wander(self, nano: Nano):
         """Make nano wander to a random location"""
         # Pick a random grid position to move to - adjusted for larger grid
-        grid_cols = PLAY_AREA_WIDTH // GRID_SIZE
-        grid_rows = PLAY_AREA_HEIGHT // GRID_SIZE
-        
-        target_grid_x = random.randint(1, grid_cols - 2)
-        target_grid_y = random.randint(1, grid_rows - 2)
+        target_grid_x = _randint(1, GRID_COLS - 2)
+        target_grid_y = _randint(1, GRID_ROWS - 2)
         
         nano.move_to(target_grid_x * GRID_SIZE + GRID_SIZE // 2, 
                     target_grid_y * GRID_SIZE + GRID_SIZE // 2)
@@ -893,36 +1018,24 @@ class Game:
         if nano.moving:
             return
             
-        # Check all buildings for entry
-        for building_id, building in self.state.buildings.items():
-            building_center_x = building.x * GRID_SIZE + GRID_SIZE // 2
-            building_center_y = building.y * GRID_SIZE + GRID_SIZE // 2
-            
-            # If nano is close to building center
-            distance = abs(nano.x - building_center_x) + abs(nano.y - building_center_y)
-            if distance < 20:  # Close enough to enter
-                # Check if nano should enter this building
-                should_enter = False
-                
-                if building.type == BuildingType.BIO and nano.state == NanoState.WORKING:
-                    should_enter = nano.assigned_building == building_id
-                elif building.type == BuildingType.TENT and nano.state == NanoState.SLEEPING:
-                    should_enter = nano.home_building == building_id
-                elif building.type == BuildingType.MUSIC and nano.state == NanoState.HAPPY_TIME:
-                    should_enter = True
-                elif building.type == BuildingType.STUDY and nano.state == NanoState.LEARNING:
-                    should_enter = True
-                elif building.type == BuildingType.CAMP and nano.state == NanoState.TRAINING:
-                    should_enter = True
-                    
-                if should_enter and not nano.inside_building:
-                    if nano.enter_building(building_id, self.state.buildings):
+        # Entry only happens outside a building and in a state one serves
+        if not nano.inside_building:
+            entry_type = _ENTRY_BUILDING_TYPE.get(nano.state)
+            if entry_type is BuildingType.BIO:
+                self._try_enter_building(nano, nano.assigned_building_ref)
+            elif entry_type is BuildingType.TENT:
+                self._try_enter_building(nano, nano.home_building_ref)
+            elif entry_type is not None:
+                # Any nearby building of the type will do (entry radius is well inside one bucket)
+                buildings = self.state.buildings
+                for building_id in self.state.buildings_near(nano.x, nano.y):
+                    if self._try_enter_building(nano, buildings[building_id], entry_type):
                         break
                         
         # Handle activity completion and building exit
-        if nano.inside_building and nano.current_building:
-            building = self.state.buildings.get(nano.current_building)
-            if building:
+        if nano.inside_building:
+            building = nano.current_building_ref
+            if building is not None:
                 should_exit = False
                 
                 # Check if activity is complete or time to leave
@@ -935,15 +1048,26 @@ class Game:
                 elif building.type == BuildingType.CAMP and nano.activity_timer >= nano.activity_duration:
                     nano.train()  # Gain physical attributes
                     should_exit = True
-                elif building.type == BuildingType.TENT and 6 <= self.state.game_hour < 22:
+                elif building.type == BuildingType.TENT and _HOUR_SCHEDULE[self.state.game_hour] != _SLEEP_TIME:
                     should_exit = True  # Leave home during day
-                elif building.type == BuildingType.BIO and not (8 <= self.state.game_hour < 16):
+                elif building.type == BuildingType.BIO and _HOUR_SCHEDULE[self.state.game_hour] != _WORK_TIME:
                     should_exit = True  # Leave work outside work hours
                     
                 if should_exit:
                     nano.exit_building(self.state.buildings)
                     nano.state = NanoState.IDLE
 
+    def _try_enter_building(self, nano: Nano, building: Optional[Building],
+                            building_type: Optional[BuildingType] = None) -> bool:
+        """Enter a building if it is in reach (and of the given type), returns True on entry"""
+        if building is None or (building_type is not None and building.type is not building_type):
+            return False
+        dx = nano.x - building.center_x
+        dy = nano.y - building.center_y
+        if dx * dx + dy * dy < 400:  # Within 20px, close enough to enter
+            return nano.enter_building(building.building_id, self.state.buildings)
+        return False
+
     def handle_resize(self, width: int, height: int):
         """Handle window resize"""
         self.screen_width = width
@@ -956,6 +1080,7 @@ class Game:
             width - UI_PANEL_WIDTH - INFO_PANEL_WIDTH - 30,
             height - TIME_BAR_HEIGHT - 100
         )
+        self._recompute_layout()
         
         # Update info panel position
         self.info_panel_rect = pygame.Rect(
@@ -998,22 +1123,14 @@ class Game:
 
     def is_valid_build_position(self, grid_x: int, grid_y: int) -> bool:
         """Check if position is valid for building"""
+        state = self.state
+        
         # Check bounds
-        if grid_x < 0 or grid_y < 0:
-            return False
-        if grid_x >= PLAY_AREA_WIDTH // GRID_SIZE or grid_y >= PLAY_AREA_HEIGHT // GRID_SIZE:
+        if not (0 <= grid_x < GRID_COLS and 0 <= grid_y < GRID_ROWS):
             return False
             
         # Check if position is occupied
-        for building in self.state.buildings.values():
-            if building.x == grid_x and building.y == grid_y:
-                return False
-                
-        for cell in self.state.cells.values():
-            if cell.x == grid_x and cell.y == grid_y:
-                return False
-                
-        return True
+        return not state.occupancy[grid_y * GRID_COLS + grid_x]
 
     def quit(self):
         """Clean shutdown of the game"""
@@ -7,8 +7,12 @@ images, sounds, fonts, and other resources.
 
 import pygame
 import os
+import sys
 import json
+import time
+import queue
 import logging
+import threading
 from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 from config import *
@@ -59,7 +63,10 @@ class Asset:
 class AssetLoader:
     """Main asset loading and management system"""
     
-    def __init__(self, assets_dir: str = "../assets"):
+    # Asset types a manifest entry may declare
+    _MANIFEST_TYPES = frozenset(asset_type.value for asset_type in AssetType)
+    
+    def __init__(self, assets_dir: str = ASSETS_DIR):
         self.assets_dir = assets_dir
         self.assets = {}  # Dict[str, Asset]
         self.loaded_data = {}  # Dict[str, Any] - actual pygame objects
@@ -76,6 +83,18 @@ class AssetLoader:
         self.max_cache_size = 100 * 1024 * 1024  # 100MB
         self.current_cache_size = 0
         
+        # Decoded pixel cache - lets a warm boot skip PNG decoding. The file is a
+        # JSON header line followed by the raw pixel blobs it describes, so
+        # reading it never runs code from the (user-writable) logs folder
+        self.decode_cache_file = str(LOGS_DIR / 'asset_cache.bin')
+        self.decode_cache = None  # Dict[str, tuple] - loaded on first image load
+        self.decode_cache_dirty = False
+        
+        # Background loading - guards loaded_data and asset state across threads
+        self._lock = threading.Lock()
+        self._pending = {}  # Dict[str, threading.Event] - set when a deferred load finishes
+        self._convert_queue = queue.Queue()  # (name, surface, start_time) decoded off the main thread
+        
         # Loading callbacks
         self.progress_callback = None
         self.completion_callback = None
@@ -115,8 +134,30 @@ class AssetLoader:
         self.register_asset("nano_names.json", AssetType.DATA, "nano_names.json", required=False)
         self.register_asset("building_data.json", AssetType.DATA, "building_data.json", required=False)
         
+        # Extra assets listed in the on-disk manifest, if one has been generated
+        self.register_manifest_assets()
+        
         logging.info(f"Asset manifest initialized with {len(self.assets)} assets")
         
+    def register_manifest_assets(self):
+        """Register assets from the memory-mapped manifest that are not already known"""
+        view = open_manifest_mmap()
+        if view is None:
+            return
+            
+        try:
+            # json accepts bytes directly, so the file is never decoded through a text buffer
+            manifest = json.loads(view.tobytes())
+            for name, entry in manifest.get("assets", {}).items():
+                if name in self.assets or entry.get("type") not in self._MANIFEST_TYPES:
+                    continue
+                self.register_asset(name, AssetType(entry["type"]), entry.get("path", name),
+                                    required=entry.get("required", False))
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable asset manifest: {str(e)}")
+        finally:
+            view.release()
+            
     def register_asset(self, name: str, asset_type: AssetType, file_path: str, 
                       required: bool = False, fallback_path: str = None) -> Optional[Asset]:
         """Register an asset in the manifest"""
@@ -154,6 +195,8 @@ class AssetLoader:
                     logging.error(f"Required asset failed to load: {name}")
                     success = False
                     
+        self.save_decode_cache()
+        
         # Final progress update
         self.loading_progress = 1.0
         if self.progress_callback:
@@ -162,25 +205,26 @@ class AssetLoader:
         logging.info(f"Asset loading complete: {self.loaded_assets} loaded, {self.failed_assets} failed")
         return success
         
-    def load_asset(self, name: str) -> bool:
-        """Load a specific asset by name"""
+    def load_asset(self, name: str, defer_convert: bool = False) -> bool:
+        """Load a specific asset by name (defer_convert leaves images for finish_pending_conversions)"""
         if name not in self.assets:
             logging.error(f"Asset not found in manifest: {name}")
             return False
             
         asset = self.assets[name]
         
-        if asset.state == LoadingState.LOADED:
-            return True  # Already loaded
-            
-        if asset.state == LoadingState.LOADING:
-            logging.warning(f"Asset already being loaded: {name}")
-            return False
-            
-        asset.state = LoadingState.LOADING
+        with self._lock:
+            if asset.state == LoadingState.LOADED:
+                return True  # Already loaded
+                
+            if asset.state == LoadingState.LOADING:
+                logging.warning(f"Asset already being loaded: {name}")
+                return False
+                
+            asset.state = LoadingState.LOADING
         
+        handed_off = False
         try:
-            import time
             start_time = time.time()
             
             # Check if file exists
@@ -197,7 +241,13 @@ class AssetLoader:
             
             # Load based on asset type
             if asset.type == AssetType.IMAGE or asset.type == AssetType.SPRITESHEET:
-                data = self.load_image(asset)
+                data = self.load_image(asset, convert=not defer_convert)
+                
+                # Display format conversion has to happen on the main thread
+                if defer_convert:
+                    self._convert_queue.put((name, data, start_time))
+                    handed_off = True
+                    return True
             elif asset.type == AssetType.SOUND:
                 data = self.load_sound(asset)
             elif asset.type == AssetType.FONT:
@@ -208,13 +258,14 @@ class AssetLoader:
                 raise ValueError(f"Unknown asset type: {asset.type}")
                 
             # Store loaded data
-            self.loaded_data[name] = data
-            asset.data = data
-            asset.state = LoadingState.LOADED
-            asset.load_time = time.time() - start_time
-            
-            # Update cache size
-            self.current_cache_size += asset.file_size
+            with self._lock:
+                self.loaded_data[name] = data
+                asset.data = data
+                asset.state = LoadingState.LOADED
+                asset.load_time = time.time() - start_time
+                
+                # Update cache size
+                self.current_cache_size += asset.file_size
             
             logging.debug(f"Loaded asset {name} ({asset.file_size} bytes, {asset.load_time:.3f}s)")
             return True
@@ -225,40 +276,125 @@ class AssetLoader:
             logging.error(f"Failed to load asset {name}: {str(e)}")
             return False
             
-    def load_image(self, asset: Asset) -> pygame.Surface:
+        finally:
+            # Wake anyone blocked in get_asset on this name
+            if not handed_off:
+                self._finish_pending(name)
+                
+    def _finish_pending(self, name: str):
+        """Release waiters on an asset that finished loading (or failed)"""
+        pending = self._pending.pop(name, None)
+        if pending:
+            pending.set()
+            
+    def finish_pending_conversions(self) -> int:
+        """Convert images decoded in the background - call from the main thread, returns count"""
+        finished = 0
+        while True:
+            try:
+                name, image, start_time = self._convert_queue.get_nowait()
+            except queue.Empty:
+                return finished
+                
+            asset = self.assets[name]
+            try:
+                image = self.convert_image(image)
+                with self._lock:
+                    self.loaded_data[name] = image
+                    asset.data = image
+                    asset.state = LoadingState.LOADED
+                    asset.load_time = time.time() - start_time
+                    self.current_cache_size += asset.file_size
+                finished += 1
+                
+            except Exception as e:
+                asset.state = LoadingState.FAILED
+                asset.error_message = str(e)
+                logging.error(f"Failed to convert asset {name}: {str(e)}")
+                
+            finally:
+                self._finish_pending(name)
+                
+    def wait_for_asset(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Wait for a background load to finish - returns False on timeout"""
+        pending = self._pending.get(name)
+        if not pending:
+            return True
+            
+        if threading.current_thread() is not threading.main_thread():
+            return pending.wait(timeout)
+            
+        # The main thread does the conversions itself, so keep draining while waiting
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not pending.is_set():
+            self.finish_pending_conversions()
+            if deadline is not None and time.monotonic() >= deadline:
+                return pending.is_set()
+            pending.wait(0.005)
+        return True
+                
+    def prefetch_files(self, names: List[str]) -> int:
+        """Ask the kernel to read ahead every file still needing a decode - returns bytes requested"""
+        if sys.platform != 'linux' or not hasattr(os, 'posix_fadvise'):
+            return 0
+            
+        if self.decode_cache is None:
+            self.load_decode_cache()
+            
+        try:
+            # Files with a valid decode cache entry are never read
+            paths = []
+            total_bytes = 0
+            for name in names:
+                asset = self.assets.get(name)
+                if asset is None or asset.state == LoadingState.LOADED or not os.path.exists(asset.file_path):
+                    continue
+                    
+                stat = os.stat(asset.file_path)
+                entry = self.decode_cache.get(name)
+                if entry is not None and entry[0] == (asset.file_path, stat.st_mtime_ns, stat.st_size):
+                    continue
+                    
+                paths.append(asset.file_path)
+                total_bytes += stat.st_size
+                
+            # Small, hot asset sets load faster without the extra syscalls
+            if total_bytes <= ASSET_PREFETCH_MIN_BYTES:
+                return 0
+                
+            # Queue readahead for all files at once so the reads overlap
+            for path in paths:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+                    
+            logging.debug(f"Prefetching {len(paths)} asset files ({total_bytes} bytes)")
+            return total_bytes
+            
+        except OSError as e:
+            logging.debug(f"Asset prefetch skipped: {str(e)}")
+            return 0
+            
+    def mark_pending(self, names: List[str]):
+        """Register assets that will be loaded in the background"""
+        for name in names:
+            if name in self.assets and not self.is_loaded(name):
+                self._pending.setdefault(name, threading.Event())
+            
+    def load_image(self, asset: Asset, convert: bool = True) -> pygame.Surface:
         """Load an image asset"""
         try:
-            image = pygame.image.load(asset.file_path)
+            image = self.decode_image(asset)
             
             # Convert for better performance
-            if image.get_alpha() is not None:
-                image = image.convert_alpha()
-            else:
-                image = image.convert()
+            if convert:
+                image = self.convert_image(image)
                 
             # Validate sprite sheet dimensions
             if asset.type == AssetType.SPRITESHEET:
-                actual_width = image.get_width()
-                actual_height = image.get_height()
-                
-                # Update sprite sheet properties based on actual dimensions
-                if asset.name == "nanos.png":
-                    # Auto-detect sprite sheet layout
-                    asset.sprite_width = 16
-                    asset.sprite_height = 16
-                    asset.sprites_per_row = actual_width // 16
-                    asset.total_sprites = (actual_width // 16) * (actual_height // 16)
-                    
-                    logging.info(f"Auto-detected sprite sheet: {actual_width}x{actual_height}, "
-                               f"{asset.sprites_per_row}x{actual_height//16} sprites")
-                else:
-                    expected_width = asset.sprite_width * asset.sprites_per_row
-                    expected_height = asset.sprite_height * (asset.total_sprites // asset.sprites_per_row)
-                    
-                    if actual_width != expected_width or actual_height != expected_height:
-                        logging.warning(f"Sprite sheet {asset.name} dimensions don't match expected size: "
-                                      f"expected {expected_width}x{expected_height}, "
-                                      f"got {actual_width}x{actual_height}")
+                self.update_spritesheet_layout(asset, image)
                     
             logging.debug(f"Loaded image {asset.name}: {image.get_width()}x{image.get_height()}")
             return image
@@ -266,6 +402,164 @@ class AssetLoader:
         except Exception as e:
             raise Exception(f"Failed to load image: {str(e)}")
             
+    def convert_image(self, image: pygame.Surface) -> pygame.Surface:
+        """Convert an image to the display pixel format - needs the display surface"""
+        if image.get_alpha() is not None:
+            return image.convert_alpha()
+        return image.convert()
+        
+    def update_spritesheet_layout(self, asset: Asset, image: pygame.Surface):
+        """Update sprite sheet properties from the loaded image size"""
+        actual_width = image.get_width()
+        actual_height = image.get_height()
+        
+        # Update sprite sheet properties based on actual dimensions
+        if asset.name == "nanos.png":
+            # Auto-detect sprite sheet layout
+            asset.sprite_width = 16
+            asset.sprite_height = 16
+            asset.sprites_per_row = actual_width // 16
+            asset.total_sprites = (actual_width // 16) * (actual_height // 16)
+            
+            logging.info(f"Auto-detected sprite sheet: {actual_width}x{actual_height}, "
+                       f"{asset.sprites_per_row}x{actual_height//16} sprites")
+        else:
+            expected_width = asset.sprite_width * asset.sprites_per_row
+            expected_height = asset.sprite_height * (asset.total_sprites // asset.sprites_per_row)
+            
+            if actual_width != expected_width or actual_height != expected_height:
+                logging.warning(f"Sprite sheet {asset.name} dimensions don't match expected size: "
+                              f"expected {expected_width}x{expected_height}, "
+                              f"got {actual_width}x{actual_height}")
+        
+    def load_atlas(self, atlas_file: str, index_file: str) -> List[str]:
+        """Load images packed by build_atlas.py - returns names that were loaded"""
+        try:
+            start_time = time.time()
+            
+            with open(index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+                
+            # One decode for every packed image
+            atlas = self.load_image(Asset("atlas.png", AssetType.IMAGE, atlas_file))
+            
+        except Exception as e:
+            logging.warning(f"Texture atlas unavailable, loading files individually: {str(e)}")
+            return []
+            
+        loaded = []
+        for name, rect in index.items():
+            asset = self.assets.get(name)
+            if asset is None or asset.state == LoadingState.LOADED:
+                continue
+                
+            try:
+                # Subsurfaces share the atlas pixels - no copy
+                image = atlas.subsurface(pygame.Rect(rect))
+                if asset.type == AssetType.SPRITESHEET:
+                    self.update_spritesheet_layout(asset, image)
+                    
+                self.loaded_data[name] = image
+                asset.data = image
+                asset.state = LoadingState.LOADED
+                asset.load_time = time.time() - start_time
+                loaded.append(name)
+                
+            except Exception as e:
+                logging.warning(f"Bad atlas entry {name}: {str(e)}")
+                
+        logging.info(f"Loaded {len(loaded)} images from texture atlas")
+        return loaded
+        
+    def decode_image(self, asset: Asset) -> pygame.Surface:
+        """Decode an image file, reusing pixels cached by a previous boot"""
+        if self.decode_cache is None:
+            with self._lock:
+                if self.decode_cache is None:
+                    self.load_decode_cache()
+            
+        # Entries are only valid for the exact file they were decoded from
+        stat = os.stat(asset.file_path)
+        file_key = (asset.file_path, stat.st_mtime_ns, stat.st_size)
+        
+        entry = self.decode_cache.get(asset.name)
+        if entry is not None and entry[0] == file_key:
+            _, size, pixel_format, raw, colorkey = entry
+            image = pygame.image.frombuffer(raw, size, pixel_format)
+            if colorkey is not None:
+                image.set_colorkey(colorkey)
+            return image
+            
+        image = pygame.image.load(asset.file_path)
+        
+        # Keep the alpha channel only for images that have one; the colorkey of
+        # paletted images is not part of the raw pixels, so store it alongside
+        pixel_format = 'RGBA' if image.get_alpha() is not None else 'RGB'
+        raw = pygame.image.tostring(image, pixel_format)
+        self.decode_cache[asset.name] = (file_key, image.get_size(), pixel_format, raw,
+                                         image.get_colorkey())
+        self.decode_cache_dirty = True
+        
+        return image
+        
+    def load_decode_cache(self):
+        """Load the decoded pixel cache from disk"""
+        decode_cache = {}
+        
+        if self.cache_enabled and os.path.exists(self.decode_cache_file):
+            try:
+                with open(self.decode_cache_file, 'rb') as f:
+                    header = json.loads(f.readline())
+                    blob = f.read()
+                    
+                for name, (file_key, size, pixel_format, colorkey, offset, length) in header.items():
+                    width, height = size
+                    if pixel_format not in ('RGB', 'RGBA') or length != width * height * len(pixel_format):
+                        continue  # Skip anything that could not be a frombuffer payload
+                    raw = blob[offset:offset + length]
+                    if len(raw) != length:
+                        continue  # Truncated file
+                    decode_cache[name] = (tuple(file_key), (width, height), pixel_format, raw,
+                                          None if colorkey is None else tuple(colorkey))
+                logging.debug(f"Loaded asset cache with {len(decode_cache)} entries")
+                
+            except Exception as e:
+                logging.warning(f"Ignoring unreadable asset cache: {str(e)}")
+                decode_cache = {}
+                
+        # Publish in one step so concurrent decoders never see a half-loaded cache
+        self.decode_cache = decode_cache
+        
+    def save_decode_cache(self):
+        """Write the decoded pixel cache to disk if it changed"""
+        if not self.cache_enabled or not self.decode_cache_dirty:
+            return
+            
+        try:
+            os.makedirs(os.path.dirname(self.decode_cache_file), exist_ok=True)
+            
+            # Header maps name -> (file key, size, format, colorkey, offset, length)
+            header = {}
+            blobs = []
+            offset = 0
+            for name, (file_key, size, pixel_format, raw, colorkey) in list(self.decode_cache.items()):
+                header[name] = (file_key, size, pixel_format, colorkey, offset, len(raw))
+                blobs.append(raw)
+                offset += len(raw)
+                
+            # Write to a temp file first so a crash never leaves a torn cache
+            temp_file = self.decode_cache_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b'\n')
+                f.writelines(blobs)
+            os.replace(temp_file, self.decode_cache_file)
+            
+            self.decode_cache_dirty = False
+            logging.debug(f"Saved asset cache with {len(self.decode_cache)} entries")
+            
+        except Exception as e:
+            logging.warning(f"Failed to save asset cache: {str(e)}")
+            
     def load_sound(self, asset: Asset) -> pygame.mixer.Sound:
         """Load a sound asset"""
         try:
@@ -304,9 +598,13 @@ class AssetLoader:
         except Exception as e:
             raise Exception(f"Failed to load data: {str(e)}")
             
-    def get_asset(self, name: str) -> Any:
-        """Get a loaded asset by name"""
-        return self.loaded_data.get(name)
+    def get_asset(self, name: str, timeout: Optional[float] = None) -> Any:
+        """Get a loaded asset by name, waiting for it if it is still loading in the background"""
+        data = self.loaded_data.get(name)
+        if data is None and name in self._pending:
+            self.wait_for_asset(name, timeout)
+            data = self.loaded_data.get(name)
+        return data
         
     def get_asset_info(self, name: str) -> Optional[Asset]:
         """Get asset information"""
@@ -507,6 +805,10 @@ class AssetLoader:
     def cleanup(self):
         """Clean up all loaded assets"""
         try:
+            # Let background loads finish before tearing down
+            for name in list(self._pending):
+                self.wait_for_asset(name, 5.0)
+                
             # Unload all assets
             for name in list(self.loaded_data.keys()):
                 self.unload_asset(name)
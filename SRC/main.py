@@ -16,7 +16,7 @@ from typing import Optional, Dict, Any
 # Import game modules (all in same directory)
 from config import *
 from boot import BootManager, quick_boot, debug_boot
-from game import Game
+from game import Game, MOUSE_BUTTON_EVENTS, KEY_EVENTS
 from ui import UIRenderer
 from environment import EnvironmentManager
 from models import GameState
@@ -198,33 +198,41 @@ class GameApplication:
             
     def handle_events(self):
         """Handle all pygame events"""
-        events = pygame.event.get()
+        # Let SDL split the queue by type; whatever is left is drained last. Pump
+        # once up front so no event can arrive between the gets and be drained by
+        # the catch-all get, which only handles window events
+        pygame.event.pump()
+        mouse_events = pygame.event.get(MOUSE_BUTTON_EVENTS, pump=False)
+        key_events = pygame.event.get(KEY_EVENTS, pump=False)
+        events = pygame.event.get(pump=False)
         
         for event in events:
             if event.type == pygame.QUIT:
                 self.request_shutdown()
                 
-            elif event.type == pygame.KEYDOWN:
-                self.handle_key_down(event)
-                
-            elif event.type == pygame.KEYUP:
-                self.handle_key_up(event)
-                
             elif event.type == pygame.VIDEORESIZE:
                 self.handle_window_resize(event.w, event.h)
                 
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if self.debug_mode:
-                    logging.debug(f"Mouse button {event.button} pressed at {event.pos}")
-                    
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if self.debug_mode:
-                    logging.debug(f"Mouse button {event.button} released at {event.pos}")
+        # Coalesce the frame's key events: a key repeated or mashed faster than the
+        # frame rate triggers its hotkey once, so toggles can't thrash
+        keys_down = set()
+        for event in key_events:
+            if event.type == pygame.KEYDOWN:
+                if event.key not in keys_down:
+                    keys_down.add(event.key)
+                    self.handle_key_down(event)
+            else:
+                self.handle_key_up(event)
+                
+        if self.debug_mode:
+            for event in mouse_events:
+                state = "pressed" if event.type == pygame.MOUSEBUTTONDOWN else "released"
+                logging.debug(f"Mouse button {event.button} {state} at {event.pos}")
                     
         # Pass events to game system
         if self.game:
             # Store events for the game to process
-            self.game.input_handler.update(events)
+            self.game.input_handler.update(mouse_events, key_events)
             
     def handle_key_down(self, event):
         """Handle key press events"""
@@ -261,7 +269,7 @@ class GameApplication:
         """Handle window resize events"""
         try:
             # Update configuration
-            update_display_config(width, height)
+            set_runtime_config(update_display_config(get_runtime_config(), width, height))
             
             # Recreate display surface
             self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
@@ -284,7 +292,8 @@ class GameApplication:
         try:
             # Update environment first (affects everything else)
             if self.environment_manager:
-                self.environment_manager.update(dt, WINDOW_WIDTH, WINDOW_HEIGHT)
+                runtime = get_runtime_config()
+                self.environment_manager.update(dt, runtime.display.window_width, runtime.display.window_height)
                 
             # Update main game logic
             if self.game:
@@ -412,6 +421,10 @@ class GameApplication:
             
     def post_frame_cleanup(self):
         """Perform any cleanup after frame rendering"""
+        # Finish assets the background loader decoded since last frame
+        if self.asset_loader:
+            self.asset_loader.finish_pending_conversions()
+            
         # Occasional garbage collection in debug mode
         if self.debug_mode and self.frame_count % (60 * 60) == 0:  # Every minute
             import gc
@@ -423,7 +436,8 @@ class GameApplication:
             # This is a simple toggle - more sophisticated fullscreen handling could be added
             current_flags = self.screen.get_flags()
             if current_flags & pygame.FULLSCREEN:
-                self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
+                runtime = get_runtime_config()
+                self.screen = pygame.display.set_mode((runtime.display.window_width, runtime.display.window_height), pygame.RESIZABLE)
                 logging.info("Switched to windowed mode")
             else:
                 self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
@@ -135,15 +135,21 @@ class Cell:
 
 class Building:
     """Base building class"""
+    __slots__ = ('type', 'x', 'y', 'center_x', 'center_y', 'level', 'occupied', 'workers',
+                 'capacity', 'building_id', 'free_index')
+    
     def __init__(self, building_type: BuildingType, x: int, y: int, level: int = 1):
         self.type = building_type
         self.x = x
         self.y = y
+        self.center_x = x * GRID_SIZE + GRID_SIZE // 2  # Play-area pixel center
+        self.center_y = y * GRID_SIZE + GRID_SIZE // 2
         self.level = level
         self.occupied = False
-        self.workers = []  # List of Nano IDs working here
+        self.workers = set()  # Set of Nano IDs working here
         self.capacity = self.get_capacity()
         self.building_id = None  # Will be set when added to game state
+        self.free_index = None  # GameState's dict of free building ids for this type, set when added
         
     def get_capacity(self) -> int:
         """Get worker capacity for this building"""
@@ -158,15 +164,7 @@ class Building:
         
     def get_build_cost(self) -> Tuple[float, float]:
         """Returns (EU_cost, Credits_cost) for building"""
-        costs = {
-            BuildingType.CELL: (1.0, 100.0),
-            BuildingType.BIO: (10.0, 1000.0),
-            BuildingType.TENT: (10.0, 100.0),
-            BuildingType.STUDY: (10.0, 100.0),
-            BuildingType.MUSIC: (10.0, 500.0),
-            BuildingType.CAMP: (10.0, 250.0)
-        }
-        return costs.get(self.type, (1.0, 100.0))
+        return building_cost(self.type.name)  # BuildingType names match BuildingKind
         
     def can_accept_worker(self) -> bool:
         """Check if building can accept more workers"""
@@ -175,7 +173,9 @@ class Building:
     def add_worker(self, nano_id: int) -> bool:
         """Add a worker to this building"""
         if self.can_accept_worker() and nano_id not in self.workers:
-            self.workers.append(nano_id)
+            self.workers.add(nano_id)
+            if self.free_index is not None and not self.can_accept_worker():
+                self.free_index.pop(self.building_id, None)
             return True
         return False
         
@@ -183,11 +183,23 @@ class Building:
         """Remove a worker from this building"""
         if nano_id in self.workers:
             self.workers.remove(nano_id)
+            if self.free_index is not None:
+                self.free_index[self.building_id] = None
             return True
         return False
 
 class Nano:
     """Represents a Nano worker in the game"""
+    __slots__ = ('id', 'name', 'level', 'age', 'max_lifespan', 'skills',
+                 'speed', 'wage', 'happy', 'health', 'brain', 'force',
+                 'x', 'y', 'target_x', 'target_y', 'moving', 'direction',
+                 'state', 'assigned_building', 'home_building', 'current_building',
+                 'assigned_building_ref', 'home_building_ref', 'current_building_ref',
+                 'work_hours', 'sleep_hours', 'other_hours', 'last_meal_time', 'meals_today',
+                 'inside_building', 'on_grid_path', 'on_border_path',
+                 'activity_timer', 'activity_duration', 'animation_frame', 'animation_timer',
+                 'selected', 'hours_without_food', 'hours_homeless')
+    
     def __init__(self, nano_id: int, name: str = None):
         self.id = nano_id
         self.name = name or f"Nano_{nano_id}"
@@ -225,6 +237,10 @@ class Nano:
         self.assigned_building = None  # Building ID for work
         self.home_building = None     # Building ID for home
         self.current_building = None  # Building ID currently inside
+        # Resolved Building objects for the ids above, kept in step with them
+        self.assigned_building_ref = None
+        self.home_building_ref = None
+        self.current_building_ref = None
         self.work_hours = 0
         self.sleep_hours = 0
         self.other_hours = 0
@@ -309,6 +325,7 @@ class Nano:
             building = buildings[building_id]
             if building.add_worker(self.id):
                 self.current_building = building_id
+                self.current_building_ref = building
                 self.inside_building = True
                 return True
         return False
@@ -319,6 +336,7 @@ class Nano:
             building = buildings[self.current_building]
             building.remove_worker(self.id)
             self.current_building = None
+            self.current_building_ref = None
             self.inside_building = False
             
     def work(self, building: Building) -> float:
@@ -441,15 +459,67 @@ class Nano:
             else:
                 self.animation_frame = 0  # Static frame when not moving
 
+class FloatingLabel:
+    """A floating text label that drifts up and fades out"""
+    __slots__ = ('text', 'x', 'y', 'color', 'timer', 'vel_y')
+    
+    def __init__(self, text: str, x: float, y: float, color: Tuple[int, int, int] = (255, 255, 255)):
+        self.reset(text, x, y, color)
+        
+    def reset(self, text: str, x: float, y: float, color: Tuple[int, int, int] = (255, 255, 255)):
+        """(Re)initialize the label so pooled instances can be reused"""
+        self.text = text
+        self.x = float(x)
+        self.y = float(y)
+        self.color = color
+        self.timer = 3.0  # Display for 3 seconds
+        self.vel_y = -20.0  # Float upward slower
+
+# PowerEffect phases
+EFFECT_HOVERING = 0
+EFFECT_MOVING = 1
+EFFECT_COMPLETED = 2
+
+class PowerEffect:
+    """An energy sprite that hovers, then flies into a target cell"""
+    __slots__ = ('x', 'y', 'target_x', 'target_y', 'target_cell', 'energy_amount',
+                 'phase', 'timer', 'hover_duration', 'scale')
+    
+    def __init__(self, x: float, y: float, target_x: float, target_y: float,
+                 target_cell: int, energy_amount: float):
+        self.reset(x, y, target_x, target_y, target_cell, energy_amount)
+        
+    def reset(self, x: float, y: float, target_x: float, target_y: float,
+              target_cell: int, energy_amount: float):
+        """(Re)initialize the effect so pooled instances can be reused"""
+        self.x = float(x)
+        self.y = float(y)
+        self.target_x = float(target_x)
+        self.target_y = float(target_y)
+        self.target_cell = target_cell
+        self.energy_amount = energy_amount
+        self.phase = EFFECT_HOVERING  # EFFECT_HOVERING -> EFFECT_MOVING -> EFFECT_COMPLETED
+        self.timer = 0.0
+        self.hover_duration = 0.5  # Hover for 0.5 seconds
+        self.scale = 1.0  # For pulsing effect
+
 class GameState:
     """Manages the overall game state"""
     def __init__(self):
         self.resources = Resource()
         self.cells = {}  # Dict of cell_number -> Cell
+        self.cell_list = []  # Same cells as a list, for O(1) random picks
         self.buildings = {}  # Dict of building_id -> Building
         self.nanos = {}  # Dict of nano_id -> Nano
         self.hired_nanos = []  # List of available Nanos for hire
         
+        # Grid lookups kept in step with cells/buildings (first occupant wins)
+        self.cell_grid = {}  # Dict of (grid_x, grid_y) -> cell_number
+        self.building_grid = {}  # Dict of (grid_x, grid_y) -> building_id
+        self.building_buckets = {}  # Dict of (bucket_x, bucket_y) -> [building_id, ...]
+        self.free_by_type = {}  # Dict of BuildingType -> {building_id: None} with room for workers
+        self.occupancy = bytearray(GRID_COLS * GRID_ROWS)  # 1 where a cell or building stands
+        
         # Game time - now tracks precise time with minutes
         self.game_hour = 0  # 0-23 hours
         self.game_minute = 0  # 0-59 minutes  
@@ -519,32 +589,47 @@ class GameState:
         
     def start_nano_grid_movement(self, nano: Nano):
         """Start a nano moving along grid lines"""
-        import random
         # Pick a random grid position to move to
-        grid_cols = PLAY_AREA_WIDTH // GRID_SIZE
-        grid_rows = PLAY_AREA_HEIGHT // GRID_SIZE
-        
-        target_grid_x = random.randint(1, grid_cols - 2)
-        target_grid_y = random.randint(1, grid_rows - 2)
+        target_grid_x = random.randint(1, GRID_COLS - 2)
+        target_grid_y = random.randint(1, GRID_ROWS - 2)
         
         nano.move_to(target_grid_x * GRID_SIZE + GRID_SIZE // 2, 
                     target_grid_y * GRID_SIZE + GRID_SIZE // 2)
         nano.on_grid_path = True  # Mark as moving on grid
 
+    def cell_at(self, grid_x: int, grid_y: int) -> Optional[Cell]:
+        """Get the cell at a grid position, if any"""
+        cell_number = self.cell_grid.get((grid_x, grid_y))
+        return None if cell_number is None else self.cells[cell_number]
+        
+    def building_at(self, grid_x: int, grid_y: int) -> Optional[Building]:
+        """Get the building at a grid position, if any"""
+        building_id = self.building_grid.get((grid_x, grid_y))
+        return None if building_id is None else self.buildings[building_id]
+        
+    def _mark_occupied(self, grid_x: int, grid_y: int):
+        """Flag a grid position in the occupancy map (positions off the grid are ignored)"""
+        if 0 <= grid_x < GRID_COLS and 0 <= grid_y < GRID_ROWS:
+            self.occupancy[grid_y * GRID_COLS + grid_x] = 1
+            
+    def buildings_near(self, px: float, py: float) -> List[int]:
+        """Get ids of buildings whose centers share or border the bucket of a pixel position"""
+        bx = int(px) // BUILDING_BUCKET_SIZE
+        by = int(py) // BUILDING_BUCKET_SIZE
+        buckets = self.building_buckets
+        nearby = []
+        for ny in (by - 1, by, by + 1):
+            for nx in (bx - 1, bx, bx + 1):
+                ids = buckets.get((nx, ny))
+                if ids:
+                    nearby.extend(ids)
+        return nearby
+        
     def find_available_building(self, building_type: BuildingType) -> Optional[int]:
         """Find an available building of specified type"""
-        for building_id, building in self.buildings.items():
-            if building.type == building_type and building.can_accept_worker():
-                return building_id
-        return None
-        
-    def assign_nano_home(self, nano: Nano):
-        """Assign a home to a nano if available"""
-        if nano.home_building is None:
-            home_id = self.find_available_building(BuildingType.TENT)
-            if home_id:
-                nano.home_building = home_id
-                
+        free = self.free_by_type.get(building_type)
+        return next(iter(free)) if free else None
+        
     def build_cell(self, x: int, y: int) -> bool:
         """Build the next sequential cell at position"""
         next_cell_number = len(self.cells) + 1  # Next cell to purchase
@@ -570,6 +655,9 @@ class GameState:
         if can_afford_eu and can_afford_credits:
             cell = Cell(next_cell_number, x, y)
             self.cells[next_cell_number] = cell  # Use cell_number as key
+            self.cell_list.append(cell)
+            self.cell_grid.setdefault((x, y), next_cell_number)
+            self._mark_occupied(x, y)
             return True
         else:
             # Refund if only one succeeded
@@ -778,6 +866,14 @@ class GameState:
         if can_afford_eu and can_afford_credits:
             building.building_id = self.next_building_id
             self.buildings[self.next_building_id] = building
+            self.building_grid.setdefault((x, y), self.next_building_id)
+            bucket = (building.center_x // BUILDING_BUCKET_SIZE,
+                      building.center_y // BUILDING_BUCKET_SIZE)
+            self.building_buckets.setdefault(bucket, []).append(self.next_building_id)
+            self._mark_occupied(x, y)
+            building.free_index = self.free_by_type.setdefault(building_type, {})
+            if building.can_accept_worker():
+                building.free_index[self.next_building_id] = None
             self.next_building_id += 1
             return True
         else:
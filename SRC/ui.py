@@ -519,20 +519,20 @@ class UIRenderer:
             pygame.draw.line(self.screen, (255, 255, 255), 
                            (x - 3, y + 3), (x + 3, y - 3), 1)
 
-    def render_power_effects(self, power_effects: List[Dict], game):
+    def render_power_effects(self, power_effects: List[PowerEffect], game):
         """Render power effect animations with energy.png sprites"""
         energy_asset = game.assets.get('power.png')  # power.png is our energy sprite
         
         for effect in power_effects:
-            x = int(effect['x'])
-            y = int(effect['y'])
+            x = int(effect.x)
+            y = int(effect.y)
             
             if energy_asset:
                 # Use the actual energy sprite - SCALE IT DOWN TO 1/10 SIZE
                 try:
                     # Scale the sprite to 1/10 size
                     original_size = energy_asset.get_size()
-                    scale_factor = effect.get('scale', 1.0) * 0.1  # 1/10 size
+                    scale_factor = effect.scale * 0.1  # 1/10 size
                     new_size = (max(1, int(original_size[0] * scale_factor)), 
                                max(1, int(original_size[1] * scale_factor)))
                     scaled_sprite = pygame.transform.scale(energy_asset, new_size)
@@ -549,16 +549,16 @@ class UIRenderer:
                 # Fallback to colored circle if no sprite
                 self.render_power_effect_fallback(effect)
                 
-    def render_power_effect_fallback(self, effect: Dict):
+    def render_power_effect_fallback(self, effect: PowerEffect):
         """Render power effect as colored circle fallback"""
-        x = int(effect['x'])
-        y = int(effect['y'])
-        scale = effect.get('scale', 1.0)
+        x = int(effect.x)
+        y = int(effect.y)
+        scale = effect.scale
         radius = max(3, int(8 * scale))
         
-        if effect['phase'] == 'hovering':
+        if effect.phase == EFFECT_HOVERING:
             color = (255, 255, 100)  # Bright yellow while hovering
-        elif effect['phase'] == 'moving':
+        elif effect.phase == EFFECT_MOVING:
             color = (100, 255, 255)  # Cyan while moving
         else:
             color = (255, 255, 255)  # White otherwise
@@ -1223,7 +1223,7 @@ class UIRenderer:
             bleed_text = f"Bleed Cap: {game_state.resources.surge_capacitor:.1f} / 1.5 EU"
             self.draw_text(bleed_text, self.font_medium, lcd_red, x_start, y_bottom)
         
-    def render_floating_labels(self, floating_labels: List[Dict]):
+    def render_floating_labels(self, floating_labels: List[FloatingLabel]):
         """Render floating text labels"""
         if not floating_labels:
             print("No floating labels to render")
@@ -1231,29 +1231,29 @@ class UIRenderer:
             
         print(f"Rendering {len(floating_labels)} floating labels")
         for i, label in enumerate(floating_labels):
-            print(f"Label {i}: '{label['text']}' at ({label['x']}, {label['y']}) timer: {label['timer']}")
+            print(f"Label {i}: '{label.text}' at ({label.x}, {label.y}) timer: {label.timer}")
             
             # Calculate alpha based on remaining time
-            alpha_factor = min(1.0, label['timer'] / 3.0)  # Fade over 3 seconds
+            alpha_factor = min(1.0, label.timer / 3.0)  # Fade over 3 seconds
             alpha = int(255 * alpha_factor)
             
             if alpha > 0:
-                x, y = int(label['x']), int(label['y'])
+                x, y = int(label.x), int(label.y)
                 
                 # Draw black outline for visibility
                 outline_color = (0, 0, 0)
                 for dx in [-1, 0, 1]:
                     for dy in [-1, 0, 1]:
                         if dx != 0 or dy != 0:
-                            outline_surface = self.font_large.render(label['text'], True, outline_color)
+                            outline_surface = self.font_large.render(label.text, True, outline_color)
                             self.screen.blit(outline_surface, (x + dx, y + dy))
                 
                 # Draw main text
-                text_surface = self.font_large.render(label['text'], True, label['color'])
+                text_surface = self.font_large.render(label.text, True, label.color)
                 if alpha < 255:
                     text_surface.set_alpha(alpha)
                 self.screen.blit(text_surface, (x, y))
-                print(f"Rendered label '{label['text']}' at ({x}, {y})")
+                print(f"Rendered label '{label.text}' at ({x}, {y})")
             
     def draw_button(self, rect: pygame.Rect, text: str, tooltip: str = "", 
                    selected: bool = False, enabled: bool = True):
@@ -1383,8 +1383,8 @@ class UIRenderer:
     def draw_connection_lines(self, game_state: GameState, play_rect: pygame.Rect):
         """Draw connection lines between buildings and assigned workers"""
         for building in game_state.buildings.values():
-            building_x = play_rect.x + building.x * GRID_SIZE + GRID_SIZE // 2
-            building_y = play_rect.y + building.y * GRID_SIZE + GRID_SIZE // 2
+            building_x = play_rect.x + building.center_x
+            building_y = play_rect.y + building.center_y
             
             for nano_id in building.workers:
                 if nano_id in game_state.nanos: